@@ -9,6 +9,7 @@ from typing import Optional, Callable, Awaitable
 
 from aiogram import Bot
 
+from services.notification_queue import fanout_send
 from bot.jobs import (
     check_ended_lessons,
     send_lesson_reminders,
@@ -67,6 +68,7 @@ class BackgroundJobs:
 
     async def _loop(self) -> None:
         """Main loop — checks timers and runs jobs as needed."""
+        fanout_send.set(True)
         last_poll = 0.0
         last_reminders = 0.0
         last_summary_date: Optional[date] = None
@@ -1,10 +1,9 @@
 """Custom filters for aiogram handlers"""
-from typing import Union
+from typing import Union, Tuple
 from aiogram.filters import Filter
 from aiogram.types import Message, CallbackQuery
-from sqlalchemy import select
-from models import Teacher, Student
 from database import SessionLocal
+from services.user_service import UserService
 
 
 class IsTeacher(Filter):
@@ -13,8 +12,7 @@ class IsTeacher(Filter):
         if not event.from_user:
             return False
         async with SessionLocal() as session:
-            result = await session.execute(select(Teacher).filter_by(telegram_id=event.from_user.id))
-            return result.scalar_one_or_none() is not None
+            return await UserService.get_teacher_by_telegram_id(session, event.from_user.id) is not None
 
 
 class IsStudent(Filter):
@@ -23,5 +21,18 @@ class IsStudent(Filter):
         if not event.from_user:
             return False
         async with SessionLocal() as session:
-            result = await session.execute(select(Student).filter_by(telegram_id=event.from_user.id))
-            return result.scalar_one_or_none() is not None
+            return await UserService.get_student_by_telegram_id(session, event.from_user.id) is not None
+
+
+class CallbackPrefix(Filter):
+    """Cheap router-level pre-filter on callback_data prefixes
+
+    Router filters run before any of the router's handlers are tried, so
+    putting this ahead of IsTeacher/IsStudent lets a router reject foreign
+    callbacks with one str.startswith instead of a role lookup.
+    """
+    def __init__(self, *prefixes: str):
+        self.prefixes: Tuple[str, ...] = prefixes
+
+    async def __call__(self, query: CallbackQuery) -> bool:
+        return bool(query.data) and query.data.startswith(self.prefixes)
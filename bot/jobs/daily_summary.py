@@ -17,12 +17,12 @@ async def send_daily_summary(bot: Bot) -> None:
     try:
         async with SessionLocal() as session:
             today = datetime.now(timezone.utc).date()
-            result = await session.execute(select(Teacher))
+            result = await session.execute(
+                select(Teacher).filter(Teacher.telegram_id.isnot(None))
+            )
             teachers = result.scalars().all()
 
             for teacher in teachers:
-                if not teacher.telegram_id:
-                    continue
                 lessons_result = await session.execute(
                     select(Lesson).options(
                         selectinload(Lesson.student)
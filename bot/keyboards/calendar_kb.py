@@ -1,11 +1,69 @@
 """Calendar keyboard builder with lesson indicators"""
 import calendar
+import functools
 from datetime import datetime, date, timedelta
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 
 DATA_IGNORE = "IGNORE"
 
 
+@functools.lru_cache(maxsize=128)
+def _month_frame(year: int, month: int) -> tuple:
+    """Build the lesson-independent parts of a month keyboard.
+
+    Returns (title_row, weekday_row, weeks, nav_row) where weeks holds the
+    plain day buttons (indicator-free) laid out by week. Everything is a
+    tuple so the cached frame can be shared; create_calendar copies rows
+    into fresh lists because callers append extra rows to the markup.
+    """
+    title_row = (
+        InlineKeyboardButton(
+            text="\U0001f4c6 " + calendar.month_name[month] + " " + str(year),
+            callback_data=DATA_IGNORE
+        ),
+    )
+    weekday_row = tuple(
+        InlineKeyboardButton(text=day, callback_data=DATA_IGNORE)
+        for day in ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+    )
+
+    blank = InlineKeyboardButton(text=" ", callback_data=DATA_IGNORE)
+    weeks = tuple(
+        tuple(
+            (day, blank if day == 0 else InlineKeyboardButton(
+                text=str(day),
+                callback_data=f"CALENDAR-DAY-{year}-{month}-{day}"
+            ))
+            for day in week
+        )
+        for week in calendar.monthcalendar(year, month)
+    )
+
+    prev_month, prev_year = (month - 1, year) if month > 1 else (12, year - 1)
+    next_month, next_year = (month + 1, year) if month < 12 else (1, year + 1)
+    nav_row = (
+        InlineKeyboardButton(text="◀️", callback_data=f"PREV-MONTH-{prev_year}-{prev_month}"),
+        InlineKeyboardButton(text=" ", callback_data=DATA_IGNORE),
+        InlineKeyboardButton(text="▶️", callback_data=f"NEXT-MONTH-{next_year}-{next_month}")
+    )
+    return title_row, weekday_row, weeks, nav_row
+
+
+def _day_text(day: int, day_info: dict) -> str:
+    """Day label with paid/unpaid indicator"""
+    lesson_count = day_info.get('count', 0)
+    if day_info.get('has_unpaid', False):
+        return f"{day} \U0001f534"
+    if lesson_count > 0:
+        all_paid = day_info.get('all_paid', False)
+        if all_paid and lesson_count > 1:
+            return f"{day} \U0001f7e1"
+        if all_paid:
+            return f"{day} \U0001f7e2"
+        return f"{day} \U0001f534"
+    return str(day)
+
+
 def create_calendar(
     year: int = None,
     month: int = None,
@@ -25,62 +83,22 @@ def create_calendar(
     if month is None:
         month = now.month
 
-    keyboard = []
+    title_row, weekday_row, weeks, nav_row = _month_frame(year, month)
+    keyboard = [list(title_row), list(weekday_row)]
 
-    # Month and Year
-    keyboard.append([
-        InlineKeyboardButton(
-            text="\U0001f4c6 " + calendar.month_name[month] + " " + str(year),
-            callback_data=DATA_IGNORE
-        )
-    ])
-
-    # Days of week
-    keyboard.append([
-        InlineKeyboardButton(text=day, callback_data=DATA_IGNORE)
-        for day in ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-    ])
-
-    my_calendar = calendar.monthcalendar(year, month)
-    for week in my_calendar:
+    for week in weeks:
         row = []
-        for day in week:
-            if day == 0:
-                row.append(InlineKeyboardButton(text=" ", callback_data=DATA_IGNORE))
-            else:
-                date_str = f"{year}-{month:02d}-{day:02d}"
-                day_info = lesson_data.get(date_str, {'count': 0, 'has_unpaid': False}) if lesson_data else {'count': 0, 'has_unpaid': False}
-                lesson_count = day_info.get('count', 0)
-                has_unpaid = day_info.get('has_unpaid', False)
-
-                if has_unpaid:
-                    day_text = f"{day} \U0001f534"
-                elif lesson_count > 0:
-                    all_paid = day_info.get('all_paid', False)
-                    if all_paid and lesson_count > 1:
-                        day_text = f"{day} \U0001f7e1"
-                    elif all_paid:
-                        day_text = f"{day} \U0001f7e2"
-                    else:
-                        day_text = f"{day} \U0001f534"
-                else:
-                    day_text = str(day)
-
-                row.append(InlineKeyboardButton(
-                    text=day_text,
-                    callback_data=f"CALENDAR-DAY-{year}-{month}-{day}"
-                ))
+        for day, button in week:
+            day_info = lesson_data.get(f"{year}-{month:02d}-{day:02d}") if lesson_data and day else None
+            if day_info and (day_info.get('count', 0) or day_info.get('has_unpaid', False)):
+                button = InlineKeyboardButton(
+                    text=_day_text(day, day_info),
+                    callback_data=button.callback_data
+                )
+            row.append(button)
         keyboard.append(row)
 
-    # Navigation
-    prev_month, prev_year = (month - 1, year) if month > 1 else (12, year - 1)
-    next_month, next_year = (month + 1, year) if month < 12 else (1, year + 1)
-
-    keyboard.append([
-        InlineKeyboardButton(text="◀️", callback_data=f"PREV-MONTH-{prev_year}-{prev_month}"),
-        InlineKeyboardButton(text=" ", callback_data=DATA_IGNORE),
-        InlineKeyboardButton(text="▶️", callback_data=f"NEXT-MONTH-{next_year}-{next_month}")
-    ])
+    keyboard.append(list(nav_row))
 
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
@@ -1,8 +1,7 @@
 """Main menu keyboard builder"""
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from models import Teacher, Student
+from services.user_cache import get_teacher_id, get_student_id
 
 
 async def build_main_menu(telegram_id: int, session: AsyncSession) -> InlineKeyboardMarkup:
@@ -12,9 +11,7 @@ async def build_main_menu(telegram_id: int, session: AsyncSession) -> InlineKeyb
         [InlineKeyboardButton(text="🗓 My Schedule", callback_data='my_schedule')],
     ]
 
-    result = await session.execute(select(Teacher).filter_by(telegram_id=telegram_id))
-    teacher = result.scalar_one_or_none()
-    if teacher:
+    if await get_teacher_id(session, telegram_id) is not None:
         keyboard.append([InlineKeyboardButton(text="👥 My Students", callback_data='list_students')])
         keyboard.append([InlineKeyboardButton(text="🔁 Recurring Lessons", callback_data='recurring_menu')])
         keyboard.append([InlineKeyboardButton(text="💳 Payments", callback_data='pay_menu')])
@@ -23,9 +20,7 @@ async def build_main_menu(telegram_id: int, session: AsyncSession) -> InlineKeyb
         keyboard.append([InlineKeyboardButton(text="📊 Homework Stats", callback_data='ai_hw_stats')])
         keyboard.append([InlineKeyboardButton(text="📩 View Feedback", callback_data='view_feedback_start')])
     else:
-        result = await session.execute(select(Student).filter_by(telegram_id=telegram_id))
-        student = result.scalar_one_or_none()
-        if student:
+        if await get_student_id(session, telegram_id) is not None:
             keyboard.append([InlineKeyboardButton(text="📚 My Homework", callback_data='student_homework_start')])
             keyboard.append([InlineKeyboardButton(text="💬 Feedback", callback_data='feedback_start')])
             keyboard.append([InlineKeyboardButton(text="💰 Balance", callback_data='my_balance')])
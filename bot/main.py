@@ -6,14 +6,14 @@ from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
 
-from bot.config import BOT_TOKEN
+from bot.config import BOT_TOKEN, BOT_MAX_CONCURRENT_UPDATES, BOT_INIT_DB
 from database import init_db
 
 # Middlewares
-from bot.middlewares import DBSessionMiddleware, RateLimitMiddleware
+from bot.middlewares import DBSessionMiddleware, RateLimitMiddleware, OutgoingRateLimitMiddleware
 
 # Filters
-from bot.filters import IsTeacher, IsStudent
+from bot.filters import IsTeacher, IsStudent, CallbackPrefix
 
 # Routers
 from bot.routers.common import router as common_router
@@ -29,6 +29,7 @@ from bot.routers.ai_homework import router as ai_homework_router
 from bot.routers.payments import router as payments_router
 # Unified background jobs
 from bot.background_jobs import BackgroundJobs
+from services.notification_queue import notification_queue
 
 logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -91,12 +92,14 @@ async def main():
     """Main entry point"""
     logger.info("Starting bot...")
 
-    # Initialize database
-    await init_db()
-    logger.info("Database initialized")
+    # Initialize database (skipped when the deploy step already ran it)
+    if BOT_INIT_DB:
+        await init_db()
+        logger.info("Database initialized")
 
     # Create bot and dispatcher
     bot = Bot(token=BOT_TOKEN, default=DefaultBotProperties(parse_mode=ParseMode.HTML))
+    bot.session.middleware(OutgoingRateLimitMiddleware())
     _set_bot_instance(bot)
     dp = Dispatcher()
 
@@ -106,24 +109,33 @@ async def main():
     dp.message.middleware(RateLimitMiddleware())
     dp.callback_query.middleware(RateLimitMiddleware())
 
-    # Apply role-based filters to pure-role routers
+    # Apply role-based filters to pure-role routers. Callback routers are
+    # first narrowed to the prefixes they handle so that unrelated clicks
+    # skip the role lookup and the router's handler list entirely.
     # Teacher-only routers
     add_student_router.message.filter(IsTeacher())
+    # add_student has no callback handlers yet; add a CallbackPrefix along with the first one
     add_student_router.callback_query.filter(IsTeacher())
     payments_router.message.filter(IsTeacher())
-    payments_router.callback_query.filter(IsTeacher())
+    payments_router.callback_query.filter(CallbackPrefix('pay_', 'bulk_', 'bal_'), IsTeacher())
     create_router.message.filter(IsTeacher())
-    create_router.callback_query.filter(IsTeacher())
+    create_router.callback_query.filter(
+        CallbackPrefix('recurring_menu', 'create_recurring', 'REC-'), IsTeacher()
+    )
     convert_router.message.filter(IsTeacher())
-    convert_router.callback_query.filter(IsTeacher())
+    convert_router.callback_query.filter(CallbackPrefix('CONVERT-RECUR-', 'CONV-'), IsTeacher())
     teacher_actions_router.message.filter(IsTeacher())
-    teacher_actions_router.callback_query.filter(IsTeacher())
+    teacher_actions_router.callback_query.filter(
+        CallbackPrefix('APPROVE-RESCH-', 'DECLINE-RESCH-'), IsTeacher()
+    )
 
     # Student-only routers
     old_flow_router.message.filter(IsStudent())
-    old_flow_router.callback_query.filter(IsStudent())
+    old_flow_router.callback_query.filter(CallbackPrefix('OLD-RESCH-'), IsStudent())
     student_flow_router.message.filter(IsStudent())
-    student_flow_router.callback_query.filter(IsStudent())
+    student_flow_router.callback_query.filter(
+        CallbackPrefix('RESCH-', 'CALENDAR-DAY-', 'PREV-MONTH-', 'NEXT-MONTH-'), IsStudent()
+    )
 
     # Register routers
     dp.include_router(common_router)
@@ -155,13 +167,21 @@ async def main():
     bg_jobs.start()
     logger.info("Background jobs started")
 
+    # Outgoing lesson notifications are sent by queue workers, not handlers
+    notification_queue.start()
+
     # Start polling
     logger.info("Bot started successfully")
     try:
-        await dp.start_polling(bot)
+        await dp.start_polling(
+            bot,
+            handle_as_tasks=True,
+            tasks_concurrency_limit=BOT_MAX_CONCURRENT_UPDATES,
+        )
     finally:
         # Cleanup
         await bg_jobs.stop()
+        await notification_queue.stop()
         logger.info("Bot stopped")
 
 
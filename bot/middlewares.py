@@ -1,10 +1,13 @@
 """Middlewares for aiogram bot: DB session injection and rate limiting"""
+import asyncio
 import logging
 import time
-from typing import Any, Dict, Callable, Awaitable
+from typing import Any, Dict, Callable, Awaitable, Optional
 from aiogram import BaseMiddleware
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware
 from aiogram.types import TelegramObject, Message, CallbackQuery
-from database import SessionLocal
+from services.notification_queue import fanout_send
+from services.user_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -13,9 +16,26 @@ _rate_limit_store: Dict[int, list] = {}
 RATE_LIMIT_MAX_REQUESTS = 35
 RATE_LIMIT_WINDOW_SECONDS = 60
 
+# Outgoing limits, per Telegram's bot FAQ: ~30 messages/s overall and about
+# one message per second to the same chat (short bursts are tolerated)
+OUTGOING_GLOBAL_PER_SECOND = 30
+OUTGOING_CHAT_PER_SECOND = 1
+OUTGOING_CHAT_BURST = 3
+
 
 class DBSessionMiddleware(BaseMiddleware):
-    """Inject async database session into handler data"""
+    """Inject async database session into handler data.
+
+    The session is committed when the handler returns and rolled back if it
+    raises, so no update leaves a transaction (and its row locks) open.
+    ``session_factory`` defaults to ``database.get_session``; it is imported
+    lazily so that importing this module does not create the engine.
+    """
+
+    def __init__(self, session_factory: Optional[Callable[[], Any]] = None):
+        if session_factory is None:
+            from database import get_session as session_factory
+        self.session_factory = session_factory
 
     async def __call__(
         self,
@@ -23,7 +43,7 @@ class DBSessionMiddleware(BaseMiddleware):
         event: TelegramObject,
         data: Dict[str, Any]
     ) -> Any:
-        async with SessionLocal() as session:
+        async with self.session_factory() as session:
             data['session'] = session
             return await handler(event, data)
 
@@ -92,4 +112,51 @@ def cleanup_old_rate_limit_entries():
         if not _rate_limit_store[user_id]:
             del _rate_limit_store[user_id]
 
-    logger.debug("Cleaned up old rate limit entries")
\ No newline at end of file
+    logger.debug("Cleaned up old rate limit entries")
+
+
+class TokenBucket:
+    """Reservation-style token bucket: reserve() returns how long to wait"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def reserve(self) -> float:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class OutgoingRateLimitMiddleware(BaseRequestMiddleware):
+    """Pace bot API calls addressed to a chat so fan-outs stay under Telegram's limits.
+
+    Registered on the bot session, but only calls made while ``fanout_send``
+    is set (notification queue workers and background jobs) are paced.
+    Interactive handler replies and edits go straight through, so a handler
+    never sleeps while holding its DB session. Calls without a chat_id
+    (e.g. answerCallbackQuery) are never paced.
+    """
+
+    def __init__(self):
+        self._global = TokenBucket(OUTGOING_GLOBAL_PER_SECOND, OUTGOING_GLOBAL_PER_SECOND)
+        self._chats = TTLCache(maxsize=10000, ttl=60)
+
+    def _chat_bucket(self, chat_id) -> TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            bucket = TokenBucket(OUTGOING_CHAT_PER_SECOND, OUTGOING_CHAT_BURST)
+        self._chats.set(chat_id, bucket)
+        return bucket
+
+    async def __call__(self, make_request, bot, method):
+        chat_id = getattr(method, 'chat_id', None)
+        if chat_id is not None and fanout_send.get():
+            delay = max(self._global.reserve(), self._chat_bucket(chat_id).reserve())
+            if delay > 0:
+                await asyncio.sleep(delay)
+        return await make_request(bot, method)
@@ -5,11 +5,11 @@ from aiogram.filters import Command
 from aiogram.types import Message
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from models import Teacher, Student
-from bot.utils.helpers import sanitize_input
+from models import Student
+from bot.utils.helpers import sanitize_input, get_teacher
 from bot.routers.reg_helpers import validate_text
+from services.user_cache import get_teacher_id, invalidate_roster
 
 logger = logging.getLogger(__name__)
 router = Router()
@@ -23,9 +23,7 @@ class AddStudent(StatesGroup):
 @router.message(Command('add_student'))
 async def add_student_start(message: Message, state: FSMContext, session: AsyncSession):
     """Start add student flow by teacher"""
-    result = await session.execute(select(Teacher).filter_by(telegram_id=message.from_user.id))
-    teacher = result.scalar_one_or_none()
-    if not teacher:
+    if not await get_teacher_id(session, message.from_user.id):
         await message.answer("You are not registered as a teacher.")
         return
 
@@ -65,21 +63,23 @@ async def add_student_contact(message: Message, state: FSMContext, session: Asyn
     contact = sanitize_input(text)
     data = await state.get_data()
 
-    result = await session.execute(select(Teacher).filter_by(telegram_id=message.from_user.id))
-    teacher = result.scalar_one_or_none()
+    # Writes go through the verified lookup, not the bare cached id
+    teacher = await get_teacher(session, message.from_user.id)
     if not teacher:
         await message.answer("You are not registered as a teacher.")
         await state.clear()
         return
+    teacher_id = teacher.id
 
     student_name = data.get('student_name', 'Unknown')
     new_student = Student(
         name=student_name,
         contact_info=contact,
-        teacher=teacher
+        teacher_id=teacher_id
     )
     session.add(new_student)
     await session.commit()
+    await invalidate_roster(teacher_id)
 
     await state.clear()
     await message.answer(f"Student {student_name} successfully added.")
@@ -5,12 +5,13 @@ from aiogram import Router, F
 from aiogram.filters import Command
 from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup, InlineKeyboardButton
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models import Teacher, Lesson
 from bot.keyboards.calendar_kb import create_calendar
-from bot.utils.helpers import get_teacher, safe_parse_callback_int
+from bot.utils.helpers import safe_parse_callback_int, match_callback_ints, CALENDAR_DAY_RE, MONTH_NAV_RE
+from services.user_cache import get_teacher_id
 
 logger = logging.getLogger(__name__)
 router = Router()
@@ -52,10 +53,10 @@ async def get_month_lesson_data(session: AsyncSession, teacher_id: int, year: in
 async def show_calendar(message: Message, session: AsyncSession):
     """Show calendar with lesson indicators"""
     now = datetime.now(timezone.utc)
-    teacher = await get_teacher(session, message.from_user.id)
+    teacher_id = await get_teacher_id(session, message.from_user.id)
     lesson_data = {}
-    if teacher:
-        lesson_data = await get_month_lesson_data(session, teacher.id, now.year, now.month)
+    if teacher_id:
+        lesson_data = await get_month_lesson_data(session, teacher_id, now.year, now.month)
     await message.answer("<b>Select date:</b>", reply_markup=create_calendar(now.year, now.month, lesson_data))
 
 
@@ -64,10 +65,10 @@ async def calendar_callback(query: CallbackQuery, session: AsyncSession):
     """Show calendar from main menu"""
     await query.answer()
     now = datetime.now(timezone.utc)
-    teacher = await get_teacher(session, query.from_user.id)
+    teacher_id = await get_teacher_id(session, query.from_user.id)
     lesson_data = {}
-    if teacher:
-        lesson_data = await get_month_lesson_data(session, teacher.id, now.year, now.month)
+    if teacher_id:
+        lesson_data = await get_month_lesson_data(session, teacher_id, now.year, now.month)
     await query.message.edit_text("Select date:", reply_markup=create_calendar(now.year, now.month, lesson_data))
 
 
@@ -76,17 +77,16 @@ async def calendar_callback(query: CallbackQuery, session: AsyncSession):
 async def calendar_month_nav(query: CallbackQuery, session: AsyncSession):
     """Navigate months in calendar"""
     await query.answer()
-    try:
-        parts = query.data.split('-', 2)
-        year, month = map(int, parts[2].split('-'))
-    except (ValueError, IndexError):
+    parsed = match_callback_ints(MONTH_NAV_RE, query.data)
+    if parsed is None or not 1 <= parsed[1] <= 12:
         await query.message.edit_text("⚠️ Invalid calendar navigation.")
         return
+    year, month = parsed
     
-    teacher = await get_teacher(session, query.from_user.id)
+    teacher_id = await get_teacher_id(session, query.from_user.id)
     lesson_data = {}
-    if teacher:
-        lesson_data = await get_month_lesson_data(session, teacher.id, year, month)
+    if teacher_id:
+        lesson_data = await get_month_lesson_data(session, teacher_id, year, month)
     
     await query.message.edit_text("<b>Select date:</b>", reply_markup=create_calendar(year, month, lesson_data))
 
@@ -96,21 +96,20 @@ async def calendar_day_select(query: CallbackQuery, session: AsyncSession, state
     """Handle day selection in calendar"""
     await query.answer()
     try:
-        _, date_info = query.data.split("CALENDAR-DAY-", 1)
-        year, month, day = map(int, date_info.split('-'))
+        year, month, day = match_callback_ints(CALENDAR_DAY_RE, query.data)
         selected_date = date(year, month, day)
-    except (ValueError, IndexError):
+    except (TypeError, ValueError):
         await query.message.edit_text("⚠️ Invalid date selection.")
         return
     
-    teacher = await get_teacher(session, query.from_user.id)
-    if not teacher:
+    teacher_id = await get_teacher_id(session, query.from_user.id)
+    if not teacher_id:
         await query.message.edit_text("⚠️ You are not registered as a teacher.")
         return
 
     result = await session.execute(
-        select(Lesson).options(selectinload(Lesson.student)).filter(
-            Lesson.teacher_id == teacher.id,
+        select(Lesson).options(joinedload(Lesson.student)).filter(
+            Lesson.teacher_id == teacher_id,
             Lesson.date == selected_date
         )
     )
@@ -208,7 +207,7 @@ async def forfeit_lesson_back(query: CallbackQuery, session: AsyncSession):
         await query.message.edit_text("⚠️ Lesson not found.")
         return
 
-    sel = select(Lesson).options(selectinload(Lesson.student)).filter(
+    sel = select(Lesson).options(joinedload(Lesson.student)).filter(
         Lesson.teacher_id == lesson.teacher_id,
         Lesson.date == lesson.date
     )
@@ -226,7 +225,7 @@ async def forfeit_lesson_confirm(query: CallbackQuery, session: AsyncSession):
         return
 
     result = await session.execute(
-        select(Lesson).options(selectinload(Lesson.student)).filter(Lesson.id == lesson_id)
+        select(Lesson).options(joinedload(Lesson.student)).filter(Lesson.id == lesson_id)
     )
     lesson = result.scalar_one_or_none()
     if not lesson:
@@ -8,13 +8,15 @@ from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
-from models import Teacher, Student, Lesson
+from models import Student, Lesson
 from services.lesson_service import LessonService
 from services.notification_service import NotificationService
+from services.notification_queue import notification_queue
 from services.payment.bulk_balance import apply_balance_to_lesson
-from bot.utils.helpers import get_teacher, safe_parse_callback_int
+from bot.utils.helpers import get_teacher, safe_parse_callback_int, match_callback_ints, SCHEDULE_LESSON_RE
+from services.user_cache import get_teacher_id, get_student_id, get_roster
 
 logger = logging.getLogger(__name__)
 router = Router()
@@ -29,23 +31,21 @@ class ScheduleLesson(StatesGroup):
 async def schedule_lesson_start(query: CallbackQuery, state: FSMContext, session: AsyncSession):
     """Start scheduling a lesson: select student"""
     await query.answer()
-    try:
-        _, date_info = query.data.split("SCHEDULE-LESSON-", 1)
-        year, month, day = map(int, date_info.split('-'))
-    except (ValueError, TypeError):
+    parsed = match_callback_ints(SCHEDULE_LESSON_RE, query.data)
+    if parsed is None:
         await query.message.edit_text("⚠️ Invalid callback data. Please try again.")
         await state.clear()
         return
+    year, month, day = parsed
     await state.update_data(schedule_date=(year, month, day))
 
-    teacher = await get_teacher(session, query.from_user.id)
-    if not teacher:
+    teacher_id = await get_teacher_id(session, query.from_user.id)
+    if not teacher_id:
         await query.message.edit_text("⚠️ You are not registered as a teacher.")
         await state.clear()
         return
 
-    result = await session.execute(select(Student).filter_by(teacher_id=teacher.id))
-    students = result.scalars().all()
+    students = await get_roster(session, teacher_id)
     if not students:
         await query.message.edit_text("👥 You have no students to schedule a lesson with.")
         await state.clear()
@@ -90,14 +90,13 @@ async def schedule_back_to_student(query: CallbackQuery, state: FSMContext, sess
         return
     year, month, day = data['schedule_date']
 
-    teacher = await get_teacher(session, query.from_user.id)
-    if not teacher:
+    teacher_id = await get_teacher_id(session, query.from_user.id)
+    if not teacher_id:
         await query.message.edit_text("⚠️ You are not registered as a teacher.")
         await state.clear()
         return
 
-    result = await session.execute(select(Student).filter_by(teacher_id=teacher.id))
-    students = result.scalars().all()
+    students = await get_roster(session, teacher_id)
     if not students:
         await query.message.edit_text("👥 You have no students to schedule a lesson with.")
         await state.clear()
@@ -128,14 +127,14 @@ async def schedule_back_to_date(query: CallbackQuery, state: FSMContext, session
         return
 
     selected_date = date(year, month, day)
-    teacher = await get_teacher(session, query.from_user.id)
-    if not teacher:
+    teacher_id = await get_teacher_id(session, query.from_user.id)
+    if not teacher_id:
         await query.message.edit_text("⚠️ You are not registered as a teacher.")
         return
 
     result = await session.execute(
-        select(Lesson).options(selectinload(Lesson.student)).filter(
-            Lesson.teacher_id == teacher.id,
+        select(Lesson).options(joinedload(Lesson.student)).filter(
+            Lesson.teacher_id == teacher_id,
             Lesson.date == selected_date
         )
     )
@@ -202,8 +201,7 @@ async def schedule_lesson_confirm(query: CallbackQuery, state: FSMContext, sessi
         await state.clear()
         return
 
-    result = await session.execute(select(Student).filter_by(id=student_id))
-    student = result.scalar_one_or_none()
+    student = await session.get(Student, student_id)
     if not student or student.teacher_id != teacher.id:
         await query.message.edit_text("🔒 You can only schedule lessons for your own students.")
         await state.clear()
@@ -214,30 +212,8 @@ async def schedule_lesson_confirm(query: CallbackQuery, state: FSMContext, sessi
         await state.clear()
         return
 
-    result = await session.execute(
-        select(Lesson).filter(
-            Lesson.teacher_id == teacher.id,
-            Lesson.date == lesson_date,
-            Lesson.time == lesson_time
-        )
-    )
-    if result.scalar_one_or_none():
-        await query.message.edit_text(f"⚠️ On {day}-{month}-{year} at {hour}:00 the teacher already has a lesson scheduled.")
-        await state.clear()
-        return
-
-    result = await session.execute(
-        select(Lesson).filter(
-            Lesson.student_id == student_id,
-            Lesson.date == lesson_date,
-            Lesson.time == lesson_time
-        )
-    )
-    if result.scalar_one_or_none():
-        await query.message.edit_text(f"⚠️ On {day}-{month}-{year} at {hour}:00 the student already has a lesson scheduled.")
-        await state.clear()
-        return
-
+    # The slot unique constraints are the conflict check; create_lesson
+    # reports a taken slot through its message
     success, message, lesson = await LessonService.create_lesson(
         session, teacher.id, student_id, lesson_date, lesson_time
     )
@@ -249,10 +225,10 @@ async def schedule_lesson_confirm(query: CallbackQuery, state: FSMContext, sessi
     if lesson:
         await apply_balance_to_lesson(session, lesson)
 
-    result = await session.execute(select(Student).filter_by(id=student_id))
-    student = result.scalar_one_or_none()
+    student = await session.get(Student, student_id)
     if student:
-        await NotificationService.notify_student_lesson_created(
+        notification_queue.enqueue(
+            NotificationService.notify_student_lesson_created,
             query.bot, student, teacher, lesson_date, lesson_time
         )
 
@@ -263,46 +239,30 @@ async def schedule_lesson_confirm(query: CallbackQuery, state: FSMContext, sessi
 @router.message(Command('my_schedule'))
 async def my_schedule(message: Message, session: AsyncSession):
     """Show schedule for both teachers and students"""
-    teacher_result = await session.execute(select(Teacher).filter_by(telegram_id=message.from_user.id))
-    teacher = teacher_result.scalar_one_or_none()
-    
-    if teacher:
-        today = datetime.now(timezone.utc).date()
-        result = await session.execute(
-            select(Lesson).options(selectinload(Lesson.student)).filter(
-                Lesson.teacher_id == teacher.id,
-                Lesson.date >= today
-            ).order_by(Lesson.date, Lesson.time)
-        )
-        lessons = result.scalars().all()
-        if not lessons:
+    teacher_id = await get_teacher_id(session, message.from_user.id)
+
+    if teacher_id:
+        rows = await LessonService.get_teacher_schedule(session, teacher_id)
+        if not rows:
             await message.answer("📭 You have no scheduled lessons.")
         else:
             schedule_text = "<b>Your schedule:</b>\n" + "\n".join(
-                [f"{lesson.date} {lesson.time.strftime('%H:%M')} - {lesson.student.name if lesson.student else 'Unknown'}" for lesson in lessons]
+                [f"{lesson_date} {lesson_time.strftime('%H:%M')} - {name or 'Unknown'}" for lesson_date, lesson_time, name in rows]
             )
             await message.answer(schedule_text)
         return
 
-    student_result = await session.execute(select(Student).filter_by(telegram_id=message.from_user.id))
-    student = student_result.scalar_one_or_none()
-    
-    if not student:
+    student_id = await get_student_id(session, message.from_user.id)
+
+    if not student_id:
         await message.answer("⚠️ You are not registered as a teacher or student.")
         return
 
-    today = datetime.now(timezone.utc).date()
-    result = await session.execute(
-        select(Lesson).options(selectinload(Lesson.teacher)).filter(
-            Lesson.student_id == student.id,
-            Lesson.date >= today
-        ).order_by(Lesson.date, Lesson.time)
-    )
-    lessons = result.scalars().all()
-    if not lessons:
+    rows = await LessonService.get_student_schedule(session, student_id)
+    if not rows:
         await message.answer("📭 You have no scheduled lessons.")
     else:
         schedule_text = "<b>Your schedule:</b>\n" + "\n".join(
-            [f"{lesson.date} {lesson.time.strftime('%H:%M')} - {lesson.teacher.name}" for lesson in lessons]
+            [f"{lesson_date} {lesson_time.strftime('%H:%M')} - {name}" for lesson_date, lesson_time, name in rows]
         )
         await message.answer(schedule_text)
@@ -10,6 +10,7 @@ from sqlalchemy.orm import selectinload
 
 from models import Teacher, Student, Lesson, Homework, PaymentTransaction
 from bot.utils.helpers import get_teacher, safe_parse_callback_int
+from services.user_cache import get_teacher_id, get_roster, invalidate_user, invalidate_roster
 from payment_service import PaymentService
 from handlers.payment import BulkPaymentStates
 from handlers.homework.teacher import _homework_teacher_icon
@@ -19,30 +20,50 @@ logger = logging.getLogger(__name__)
 router = Router()
 
 
+STUDENTS_PAGE_SIZE = 20
+
+
 @router.callback_query(F.data == 'list_students')
+@router.callback_query(F.data.startswith('list_students_p'))
 async def list_students_callback(query: CallbackQuery, session: AsyncSession):
-    """Show list of students with delete buttons"""
+    """Show list of students with delete buttons, one page at a time"""
     await query.answer()
-    teacher = await get_teacher(session, query.from_user.id)
-    if not teacher:
+    teacher_id = await get_teacher_id(session, query.from_user.id)
+    if not teacher_id:
         await query.message.edit_text("⚠️ You are not registered as a teacher.")
         return
 
-    result = await session.execute(select(Student).filter_by(teacher_id=teacher.id))
-    students = result.scalars().all()
+    students = await get_roster(session, teacher_id)
     if not students:
         await query.message.edit_text("👥 You have no students.")
         return
 
+    page = 0
+    if query.data.startswith('list_students_p'):
+        page = (safe_parse_callback_int(query.data, delimiter='_p') or 1) - 1
+    total_pages = (len(students) + STUDENTS_PAGE_SIZE - 1) // STUDENTS_PAGE_SIZE
+    page = max(0, min(page, total_pages - 1))
+    start = page * STUDENTS_PAGE_SIZE
+
     keyboard = []
-    for student in students:
+    for student in students[start:start + STUDENTS_PAGE_SIZE]:
         contact = student.contact_info or 'No contact'
         keyboard.append([
             InlineKeyboardButton(text=f"{student.name} - {contact}", callback_data=f"student_info-{student.id}"),
             InlineKeyboardButton(text="\U0001f5d1\ufe0f Delete", callback_data=f"delete_student-{student.id}")
         ])
+    if total_pages > 1:
+        nav_row = []
+        if page > 0:
+            nav_row.append(InlineKeyboardButton(text="\u2b05\ufe0f Prev", callback_data=f"list_students_p{page}"))
+        if page < total_pages - 1:
+            nav_row.append(InlineKeyboardButton(text="Next \u27a1\ufe0f", callback_data=f"list_students_p{page + 2}"))
+        keyboard.append(nav_row)
+        title = f"👥 Your students (page {page + 1}/{total_pages}, {len(students)} total):"
+    else:
+        title = "👥 Your students:"
     keyboard.append([InlineKeyboardButton(text="⬅️ Back", callback_data='back_to_main')])
-    await query.message.edit_text("👥 Your students:", reply_markup=InlineKeyboardMarkup(inline_keyboard=keyboard))
+    await query.message.edit_text(title, reply_markup=InlineKeyboardMarkup(inline_keyboard=keyboard))
 
 
 async def _render_student_card(query: CallbackQuery, session: AsyncSession, student: Student):
@@ -153,8 +174,7 @@ async def show_student_info(query: CallbackQuery, session: AsyncSession):
         await query.message.edit_text("⚠️ You are not registered as a teacher.")
         return
 
-    result = await session.execute(select(Student).filter_by(id=student_id))
-    student = result.scalar_one_or_none()
+    student = await session.get(Student, student_id)
     if not student or student.teacher_id != teacher.id:
         await query.message.edit_text("🔒 You can only view your own students.")
         return
@@ -329,8 +349,7 @@ async def delete_student_confirm(query: CallbackQuery, session: AsyncSession):
         await query.message.edit_text("⚠️ Invalid callback data. Please try again.")
         return
 
-    result = await session.execute(select(Student).filter_by(id=student_id))
-    student = result.scalar_one_or_none()
+    student = await session.get(Student, student_id)
     if not student or student.teacher_id != teacher.id:
         await query.message.edit_text("🔒 You can only delete your own students.")
         return
@@ -354,8 +373,7 @@ async def confirm_delete_student(query: CallbackQuery, session: AsyncSession):
         await query.message.edit_text("⚠️ Invalid callback data. Please try again.")
         return
     
-    result = await session.execute(select(Student).filter_by(id=student_id))
-    student = result.scalar_one_or_none()
+    student = await session.get(Student, student_id)
     if not student:
         await query.message.edit_text("⚠️ Student not found.")
         return
@@ -367,4 +385,6 @@ async def confirm_delete_student(query: CallbackQuery, session: AsyncSession):
 
     await session.delete(student)
     await session.commit()
+    await invalidate_user(student.telegram_id)
+    await invalidate_roster(teacher.id)
     await query.message.edit_text(f"✅ Student {student.name} has been deleted.")
@@ -6,7 +6,6 @@ from aiogram.types import Message, CallbackQuery, InlineKeyboardButton, InlineKe
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.filters import StateFilter
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models import Teacher, Student, StudentFeedback
@@ -92,8 +91,7 @@ async def feedback_text_handler(message: Message, state: FSMContext, session: As
         return
 
     # Notify teacher
-    result = await session.execute(select(Teacher).filter_by(id=student.teacher_id))
-    teacher = result.scalar_one_or_none()
+    teacher = await session.get(Teacher, student.teacher_id)
     if teacher and teacher.telegram_id:
         try:
             await message.bot.send_message(
@@ -158,8 +156,7 @@ async def view_feedback_student(query: CallbackQuery, session: AsyncSession):
         return
 
     # Verify student belongs to this teacher
-    result = await session.execute(select(Student).filter_by(id=student_id))
-    student = result.scalar_one_or_none()
+    student = await session.get(Student, student_id)
     if not student or student.teacher_id != teacher.id:
         await query.message.edit_text("🔒 You can only view feedback from your own students.")
         return
@@ -208,7 +205,6 @@ async def view_feedback_item(query: CallbackQuery, session: AsyncSession):
         return
 
     # Verify feedback belongs to this teacher's student
-    from sqlalchemy import select
     from models import Student as StudentModel
     fb_student = await session.get(StudentModel, feedback.student_id)
     if not fb_student or fb_student.teacher_id != teacher.id:
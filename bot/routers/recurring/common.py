@@ -1,19 +1,19 @@
 """Common recurring router - delete, schedule, cancel"""
 import logging
-from datetime import datetime, timezone
 from aiogram import Router, F
 from aiogram.filters import Command
 from aiogram.types import Message, CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.fsm.context import FSMContext
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
 
 from handlers.recurring import (
     smart_delete_lesson, smart_delete_once, smart_delete_series,
     view_recurring_schedule, cancel_recurring_conversation,
 )
-from models import Teacher, Student, Lesson
+from models import Teacher
+from services.lesson_service import LessonService
+from services.user_cache import get_teacher_id, get_student_id
 
 logger = logging.getLogger(__name__)
 router = Router()
@@ -72,47 +72,31 @@ async def handle_my_schedule(query: CallbackQuery, state: FSMContext, session: A
     """View schedule for both teachers and students"""
     await query.answer()
     
-    teacher_result = await session.execute(select(Teacher).filter_by(telegram_id=query.from_user.id))
-    teacher = teacher_result.scalar_one_or_none()
-    
-    if teacher:
-        today = datetime.now(timezone.utc).date()
-        result = await session.execute(
-            select(Lesson).options(selectinload(Lesson.student)).filter(
-                Lesson.teacher_id == teacher.id,
-                Lesson.date >= today
-            ).order_by(Lesson.date, Lesson.time)
-        )
-        lessons = result.scalars().all()
-        if not lessons:
+    teacher_id = await get_teacher_id(session, query.from_user.id)
+
+    if teacher_id:
+        rows = await LessonService.get_teacher_schedule(session, teacher_id)
+        if not rows:
             await query.message.edit_text("📭 You have no scheduled lessons.")
         else:
             schedule_text = "<b>Your schedule:</b>\n" + "\n".join(
-                [f"{lesson.date} {lesson.time.strftime('%H:%M')} - {lesson.student.name if lesson.student else 'Unknown'}" for lesson in lessons]
+                [f"{lesson_date} {lesson_time.strftime('%H:%M')} - {name or 'Unknown'}" for lesson_date, lesson_time, name in rows]
             )
             await query.message.edit_text(schedule_text)
         return
 
-    student_result = await session.execute(select(Student).filter_by(telegram_id=query.from_user.id))
-    student = student_result.scalar_one_or_none()
-    
-    if not student:
+    student_id = await get_student_id(session, query.from_user.id)
+
+    if not student_id:
         await query.message.edit_text("⚠️ You are not registered as a teacher or student.")
         return
-        
-    today = datetime.now(timezone.utc).date()
-    result = await session.execute(
-        select(Lesson).options(selectinload(Lesson.teacher)).filter(
-            Lesson.student_id == student.id,
-            Lesson.date >= today
-        ).order_by(Lesson.date, Lesson.time)
-    )
-    lessons = result.scalars().all()
-    if not lessons:
+
+    rows = await LessonService.get_student_schedule(session, student_id)
+    if not rows:
         await query.message.edit_text("📭 You have no scheduled lessons.")
     else:
         schedule_text = "<b>Your schedule:</b>\n" + "\n".join(
-            [f"{lesson.date} {lesson.time.strftime('%H:%M')} - {lesson.teacher.name}" for lesson in lessons]
+            [f"{lesson_date} {lesson_time.strftime('%H:%M')} - {name}" for lesson_date, lesson_time, name in rows]
         )
         await query.message.edit_text(schedule_text)
 
@@ -105,8 +105,7 @@ async def handle_conv_back_lesson(query: CallbackQuery, state: FSMContext, sessi
         await query.message.edit_text("Session expired. Please start over.")
         return
 
-    result = await session.execute(select(Lesson).filter_by(id=lesson_id))
-    lesson = result.scalar_one_or_none()
+    lesson = await session.get(Lesson, lesson_id)
     if not lesson:
         await query.message.edit_text("Lesson not found.")
         return
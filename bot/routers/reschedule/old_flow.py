@@ -6,9 +6,9 @@ from aiogram.filters import Command
 from aiogram.types import Message, CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
-from sqlalchemy import select
+from sqlalchemy import select, or_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, load_only
 
 from models import Teacher, Student, Lesson
 from bot.utils.helpers import get_student, sanitize_input, safe_parse_callback_int
@@ -33,7 +33,7 @@ async def old_reschedule_start(message: Message, state: FSMContext, session: Asy
 
     today = datetime.now(timezone.utc).date()
     result = await session.execute(
-        select(Lesson).filter(
+        select(Lesson).options(load_only(Lesson.id, Lesson.date, Lesson.time)).filter(
             Lesson.student_id == student.id,
             Lesson.date >= today
         ).order_by(Lesson.date, Lesson.time)
@@ -89,7 +89,7 @@ async def old_reschedule_back_to_lesson(query: CallbackQuery, state: FSMContext,
 
     today = datetime.now(timezone.utc).date()
     result = await session.execute(
-        select(Lesson).filter(
+        select(Lesson).options(load_only(Lesson.id, Lesson.date, Lesson.time)).filter(
             Lesson.student_id == student.id,
             Lesson.date >= today
         ).order_by(Lesson.date, Lesson.time)
@@ -190,38 +190,33 @@ async def old_reschedule_confirm(query: CallbackQuery, state: FSMContext, sessio
     new_time = time(hour, 0)
 
     result = await session.execute(
-        select(Lesson).filter(
-            Lesson.teacher_id == lesson.teacher_id,
+        select(Lesson.teacher_id).filter(
             Lesson.date == lesson.date,
-            Lesson.time == new_time
-        )
+            Lesson.time == new_time,
+            or_(Lesson.teacher_id == lesson.teacher_id, Lesson.student_id == lesson.student_id)
+        ).limit(1)
     )
-    if result.scalar_one_or_none():
-        await query.message.edit_text(f"On {lesson.date} at {hour}:00 the teacher already has a lesson scheduled.")
+    conflict_teacher_id = result.scalar()
+    if conflict_teacher_id is not None:
+        side = "teacher" if conflict_teacher_id == lesson.teacher_id else "student"
+        await query.message.edit_text(f"On {lesson.date} at {hour}:00 the {side} already has a lesson scheduled.")
         await state.clear()
         return
 
-    result = await session.execute(
-        select(Lesson).filter(
-            Lesson.student_id == lesson.student_id,
-            Lesson.date == lesson.date,
-            Lesson.time == new_time
-        )
-    )
-    if result.scalar_one_or_none():
-        await query.message.edit_text(f"On {lesson.date} at {hour}:00 the student already has a lesson scheduled.")
-        await state.clear()
-        return
+    teacher_chat_id = lesson.teacher.telegram_id if lesson.teacher else None
+    student_name = lesson.student.name
+    old_time = lesson.time.strftime('%H:%M')
+    # End the read transaction before the Telegram round-trip
+    await session.commit()
 
-    teacher = lesson.teacher
-    if teacher and teacher.telegram_id:
+    if teacher_chat_id:
         keyboard = [
-            [InlineKeyboardButton(text="Reschedule", callback_data=f"ACCEPT-RESCHEDULE-{lesson.id}-{hour}")],
-            [InlineKeyboardButton(text="Decline", callback_data=f"DECLINE-RESCHEDULE-{lesson.id}")]
+            [InlineKeyboardButton(text="Reschedule", callback_data=f"ACCEPT-RESCHEDULE-{lesson_id}-{hour}")],
+            [InlineKeyboardButton(text="Decline", callback_data=f"DECLINE-RESCHEDULE-{lesson_id}")]
         ]
         await query.bot.send_message(
-            chat_id=teacher.telegram_id,
-            text=f"Student {lesson.student.name} requests to reschedule lesson from {lesson.time.strftime('%H:%M')} to {hour}:00 for reason: {reason}. Do you agree?",
+            chat_id=teacher_chat_id,
+            text=f"Student {student_name} requests to reschedule lesson from {old_time} to {hour}:00 for reason: {reason}. Do you agree?",
             reply_markup=InlineKeyboardMarkup(inline_keyboard=keyboard)
         )
 
@@ -5,14 +5,15 @@ from aiogram import Router, F
 from aiogram.types import CallbackQuery, Message, InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from models import Teacher, Student, Lesson, RescheduleRequest
+from models import Lesson, RescheduleRequest
+from services.lesson_service import LessonService
 from services.reschedule_service import RescheduleService
 from services.notification_service import NotificationService
+from services.notification_queue import notification_queue
 from bot.keyboards.calendar_kb import create_calendar
-from bot.utils.helpers import get_student, sanitize_input, safe_parse_callback_int
+from bot.utils.helpers import get_student, sanitize_input, safe_parse_callback_int, match_callback_ints, CALENDAR_DAY_RE, MONTH_NAV_RE
 
 logger = logging.getLogger(__name__)
 router = Router()
@@ -124,8 +125,12 @@ async def reschedule_back_to_reason(query: CallbackQuery, state: FSMContext, ses
 @router.callback_query(StudentReschedule.select_date, F.data.startswith('CALENDAR-DAY-'))
 async def reschedule_select_date(query: CallbackQuery, state: FSMContext, session: AsyncSession):
     await query.answer()
-    _, date_info = query.data.split("CALENDAR-DAY-", 1)
-    year, month, day = map(int, date_info.split('-'))
+    parsed = match_callback_ints(CALENDAR_DAY_RE, query.data)
+    if parsed is None:
+        await query.message.edit_text("⚠️ Invalid callback data. Please try again.")
+        await state.clear()
+        return
+    year, month, day = parsed
     await state.update_data(reschedule_date=(year, month, day))
 
     keyboard = [
@@ -148,8 +153,12 @@ async def reschedule_select_date(query: CallbackQuery, state: FSMContext, sessio
 async def reschedule_select_date_nav(query: CallbackQuery, state: FSMContext, session: AsyncSession):
     """Navigate calendar months in reschedule date selection"""
     await query.answer()
-    parts = query.data.split('-', 2)
-    year, month = map(int, parts[2].split('-'))
+    parsed = match_callback_ints(MONTH_NAV_RE, query.data)
+    if parsed is None:
+        await query.message.edit_text("⚠️ Invalid callback data. Please try again.")
+        await state.clear()
+        return
+    year, month = parsed
     calendar_markup = create_calendar(year, month)
     extra_row = [
         InlineKeyboardButton(text="\u2b05\ufe0f Back", callback_data="RESCH-BACK-reason"),
@@ -225,8 +234,7 @@ async def reschedule_select_time(query: CallbackQuery, state: FSMContext, sessio
     new_hour = data['reschedule_time']
     reason = data['reschedule_reason']
 
-    result = await session.execute(select(Lesson).filter_by(id=lesson_id))
-    lesson = result.scalar_one_or_none()
+    lesson = await session.get(Lesson, lesson_id)
     if not lesson:
         await query.message.edit_text("⚠️ Lesson not found.")
         await state.clear()
@@ -268,8 +276,7 @@ async def reschedule_confirm(query: CallbackQuery, state: FSMContext, session: A
     year, month, day = reschedule_date
 
     try:
-        result = await session.execute(select(Lesson).filter_by(id=lesson_id))
-        lesson = result.scalar_one_or_none()
+        lesson = await LessonService.get_lesson_with_parties(session, lesson_id)
         if not lesson:
             await state.clear()
             await query.message.edit_text("⚠️ Lesson not found.")
@@ -284,25 +291,20 @@ async def reschedule_confirm(query: CallbackQuery, state: FSMContext, session: A
             await query.message.edit_text(f"Error: {message}")
             return
 
-        result = await session.execute(select(Teacher).filter_by(id=lesson.teacher_id))
-        teacher = result.scalar_one_or_none()
-        result = await session.execute(select(Student).filter_by(id=lesson.student_id))
-        student = result.scalar_one_or_none()
+        teacher, student = lesson.teacher, lesson.student
 
         if teacher and student:
             keyboard = [
                 [InlineKeyboardButton(text="\u2705 Approve", callback_data=f"APPROVE-RESCH-{request.id}")],
                 [InlineKeyboardButton(text="\u274c Decline", callback_data=f"DECLINE-RESCH-{request.id}")]
             ]
-            try:
-                await NotificationService.notify_teacher_reschedule_request_new(
-                    query.bot, teacher, student,
-                    lesson.date, lesson.time,
-                    date(year, month, day), time(new_hour, 0),
-                    reason, InlineKeyboardMarkup(inline_keyboard=keyboard)
-                )
-            except Exception as e:
-                logger.error(f"Error sending notification to teacher: {e}")
+            notification_queue.enqueue(
+                NotificationService.notify_teacher_reschedule_request_new,
+                query.bot, teacher, student,
+                lesson.date, lesson.time,
+                date(year, month, day), time(new_hour, 0),
+                reason, InlineKeyboardMarkup(inline_keyboard=keyboard)
+            )
 
         await state.clear()
         await query.message.edit_text(f"Reschedule request sent to teacher. {message}")
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from models import Teacher, Student, Lesson, RescheduleRequest
 from services.reschedule_service import RescheduleService
 from services.notification_service import NotificationService
+from services.notification_queue import notification_queue
 from bot.utils.helpers import safe_parse_callback_int
 
 logger = logging.getLogger(__name__)
@@ -28,8 +29,7 @@ async def approve_reschedule_request(query: CallbackQuery, session: AsyncSession
         await query.message.edit_text("Only teachers can approve reschedule requests.")
         return
 
-    result = await session.execute(select(RescheduleRequest).filter_by(id=request_id))
-    req = result.scalar_one_or_none()
+    req = await session.get(RescheduleRequest, request_id)
     if not req or req.teacher_id != teacher.id:
         await query.message.edit_text("You can only approve requests for your own lessons.")
         return
@@ -40,10 +40,10 @@ async def approve_reschedule_request(query: CallbackQuery, session: AsyncSession
         return
 
     if req and lesson:
-        result = await session.execute(select(Student).filter_by(id=req.student_id))
-        student = result.scalar_one_or_none()
+        student = await session.get(Student, req.student_id)
         if student and teacher:
-            await NotificationService.notify_student_reschedule_result(
+            notification_queue.enqueue(
+                NotificationService.notify_student_reschedule_result,
                 query.bot, student, teacher,
                 lesson.date, lesson.time, accepted=True
             )
@@ -64,8 +64,7 @@ async def decline_reschedule_request(query: CallbackQuery, session: AsyncSession
         await query.message.edit_text("Only teachers can decline reschedule requests.")
         return
 
-    result = await session.execute(select(RescheduleRequest).filter_by(id=request_id))
-    req = result.scalar_one_or_none()
+    req = await session.get(RescheduleRequest, request_id)
     if not req or req.teacher_id != teacher.id:
         await query.message.edit_text("You can only decline requests for your own lessons.")
         return
@@ -76,13 +75,12 @@ async def decline_reschedule_request(query: CallbackQuery, session: AsyncSession
         return
 
     if req:
-        result = await session.execute(select(Student).filter_by(id=req.student_id))
-        student = result.scalar_one_or_none()
+        student = await session.get(Student, req.student_id)
         if student and teacher:
-            result = await session.execute(select(Lesson).filter_by(id=req.lesson_id))
-            lesson = result.scalar_one_or_none()
+            lesson = await session.get(Lesson, req.lesson_id)
             if lesson:
-                await NotificationService.notify_student_reschedule_result(
+                notification_queue.enqueue(
+                    NotificationService.notify_student_reschedule_result,
                     query.bot, student, teacher,
                     lesson.date, lesson.time, accepted=False
                 )
@@ -5,10 +5,12 @@ from aiogram.filters import Command
 from aiogram.types import Message
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
-from sqlalchemy import select
+from sqlalchemy import select, exists
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from models import Teacher, Student
 from bot.utils.helpers import sanitize_input
+from services.user_cache import invalidate_user, invalidate_roster
 from bot.routers.reg_helpers import validate_text
 
 logger = logging.getLogger(__name__)
@@ -22,8 +24,7 @@ class RegisterStudent(StatesGroup):
 @router.message(Command('register_student'))
 async def reg_student_start(message: Message, state: FSMContext, session: AsyncSession):
     """Start student registration"""
-    result = await session.execute(select(Student).filter_by(telegram_id=message.from_user.id))
-    if result.scalar_one_or_none():
+    if await session.scalar(select(exists().where(Student.telegram_id == message.from_user.id))):
         await message.answer("You are already registered as a student.")
         return
 
@@ -46,8 +47,7 @@ async def reg_student_login(message: Message, state: FSMContext, session: AsyncS
     teacher_login = sanitize_input(text)
     chat_id = message.from_user.id
 
-    result = await session.execute(select(Student).filter_by(telegram_id=chat_id))
-    if result.scalar_one_or_none():
+    if await session.scalar(select(exists().where(Student.telegram_id == chat_id))):
         await message.answer("You are already registered as a student.")
         await state.clear()
         return
@@ -66,7 +66,16 @@ async def reg_student_login(message: Message, state: FSMContext, session: AsyncS
         teacher=teacher
     )
     session.add(new_student)
-    await session.commit()
+    try:
+        await session.commit()
+    except IntegrityError:
+        # Same telegram_id registered concurrently; students.telegram_id is unique
+        await session.rollback()
+        await message.answer("You are already registered as a student.")
+        await state.clear()
+        return
+    await invalidate_user(chat_id)
+    await invalidate_roster(teacher.id)
 
     await state.clear()
     await message.answer(f"You have successfully registered as a student. Your teacher: {teacher.name}")
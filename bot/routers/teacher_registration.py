@@ -1,14 +1,17 @@
 """Teacher registration FSM"""
 import logging
+from typing import Optional
 from aiogram import Router, F
 from aiogram.filters import Command
 from aiogram.types import Message
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
-from sqlalchemy import select
+from sqlalchemy import select, exists
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from models import Teacher
 from bot.utils.helpers import sanitize_input
+from services.user_cache import invalidate_user
 from bot.routers.reg_helpers import validate_text
 
 logger = logging.getLogger(__name__)
@@ -21,12 +24,21 @@ class RegisterTeacher(StatesGroup):
     login = State()
 
 
+def _duplicate_teacher_column(error: IntegrityError) -> Optional[str]:
+    """Name the teachers column whose unique constraint was violated"""
+    detail = str(error.orig)
+    # PostgreSQL names the constraint (teachers_<column>_key), SQLite lists the column
+    if 'teachers_telegram_id_key' in detail or 'teachers.telegram_id' in detail:
+        return 'telegram_id'
+    if 'teachers_login_key' in detail or 'teachers.login' in detail:
+        return 'login'
+    return None
+
+
 @router.message(Command('register_teacher'))
 async def reg_teacher_start(message: Message, state: FSMContext, session: AsyncSession):
     """Start teacher registration"""
-    result = await session.execute(select(Teacher))
-    teachers = result.scalars().all()
-    if len(teachers) >= 1:
+    if await session.scalar(select(select(Teacher.id).exists())):
         await message.answer("Maximum 1 teacher allowed in this system.")
         return
 
@@ -83,14 +95,11 @@ async def reg_teacher_login(message: Message, state: FSMContext, session: AsyncS
     login = sanitize_input(text)
     data = await state.get_data()
 
-    result = await session.execute(select(Teacher).filter_by(login=login))
-    if result.scalar_one_or_none():
+    if await session.scalar(select(exists().where(Teacher.login == login))):
         await message.answer("⏳ This login is already in use. Please choose another one.\n\nUse /cancel to exit this conversation.")
         return
 
-    result = await session.execute(select(Teacher))
-    teachers = result.scalars().all()
-    if len(teachers) >= 1:
+    if await session.scalar(select(select(Teacher.id).exists())):
         await message.answer("Maximum 1 teacher allowed in this system.")
         await state.clear()
         return
@@ -102,7 +111,23 @@ async def reg_teacher_login(message: Message, state: FSMContext, session: AsyncS
         telegram_id=message.from_user.id
     )
     session.add(new_teacher)
-    await session.commit()
+    try:
+        await session.commit()
+    except IntegrityError as e:
+        # Login or telegram_id taken between the checks and the insert
+        await session.rollback()
+        column = _duplicate_teacher_column(e)
+        if column == 'telegram_id':
+            await message.answer("You are already registered as a teacher.")
+            await state.clear()
+        elif column == 'login':
+            await message.answer("⏳ This login is already in use. Please choose another one.\n\nUse /cancel to exit this conversation.")
+        else:
+            logger.error(f"Teacher registration failed: {e}")
+            await message.answer("⚠️ Registration failed. Please try again later.")
+            await state.clear()
+        return
+    await invalidate_user(new_teacher.telegram_id)
 
     await state.clear()
     await message.answer(f"You have successfully registered as a teacher. Your login: {login}")
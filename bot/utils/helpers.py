@@ -5,23 +5,20 @@ import re
 import logging
 from datetime import datetime
 from typing import Any
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from models import Teacher, Student
+from services.user_service import UserService
 
 logger = logging.getLogger(__name__)
 
 
 async def get_teacher(session: AsyncSession, telegram_id: int):
-    """Get teacher by telegram_id"""
-    result = await session.execute(select(Teacher).filter_by(telegram_id=telegram_id))
-    return result.scalar_one_or_none()
+    """Get teacher by telegram_id (PK lookup when the id is cached)"""
+    return await UserService.get_teacher_by_telegram_id(session, telegram_id)
 
 
 async def get_student(session: AsyncSession, telegram_id: int):
-    """Get student by telegram_id"""
-    result = await session.execute(select(Student).filter_by(telegram_id=telegram_id))
-    return result.scalar_one_or_none()
+    """Get student by telegram_id (PK lookup when the id is cached)"""
+    return await UserService.get_student_by_telegram_id(session, telegram_id)
 
 
 ACCEPTED_CANCEL_COMMANDS = {'cancel', 'exit', 'quit'}
@@ -67,6 +64,24 @@ def sanitize_json_string(json_str: str) -> str:
     return json.dumps(sanitized, indent=2, ensure_ascii=False)
 
 
+# Precompiled callback data formats produced by bot.keyboards.calendar_kb
+CALENDAR_DAY_RE = re.compile(r'^CALENDAR-DAY-(\d+)-(\d+)-(\d+)$')
+MONTH_NAV_RE = re.compile(r'^(?:PREV|NEXT)-MONTH-(\d+)-(\d+)$')
+SCHEDULE_LESSON_RE = re.compile(r'^SCHEDULE-LESSON-(\d+)-(\d+)-(\d+)$')
+
+
+def match_callback_ints(pattern: re.Pattern, data: str) -> tuple[int, ...] | None:
+    """Match callback data against a precompiled pattern.
+
+    Returns:
+        The captured groups as integers, or None if the data does not match
+    """
+    match = pattern.match(data or '')
+    if match is None:
+        return None
+    return tuple(map(int, match.groups()))
+
+
 def safe_parse_callback_int(data: str, delimiter: str = '-', position: int = -1) -> int | None:
     """Safely parse an integer from callback data.
 
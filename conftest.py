@@ -0,0 +1,124 @@
+"""Shared database fixtures.
+
+``engine``/``session`` give each test module its own in-memory SQLite schema
+and wrap every test in a transaction that is rolled back afterwards; commits
+inside the test become SAVEPOINT releases. ``sync_engine``/``sync_session``
+are the same for synchronous ORM tests. Modules that need a different setup
+define fixtures with the same names, which take precedence. ``query_counter``
+records the data statements run on ``engine``; ``module_loop`` lets
+synchronous tests (benchmarks) drive coroutines on the fixtures' loop.
+
+Without a ``-m`` selection, tests marked ``slow`` run last so ``-x`` stops
+on a fast failure before paying for them.
+"""
+import asyncio
+import pytest
+import pytest_asyncio
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from models import Base
+
+
+TEST_DB_URL = 'sqlite+aiosqlite:///:memory:'
+SYNC_TEST_DB_URL = 'sqlite:///:memory:'
+
+
+def pytest_collection_modifyitems(config, items):
+    """Run slow tests last unless a marker expression picks the set"""
+    if not config.getoption("markexpr"):
+        items.sort(key=lambda item: "slow" in item.keywords)
+
+
+def _configure_sqlite(sync_engine) -> None:
+    """Make SAVEPOINT rollbacks reliable on a throwaway SQLite database"""
+
+    # pysqlite defers BEGIN until the first DML, which breaks SAVEPOINTs;
+    # emit it ourselves so per-test rollbacks really undo everything.
+    # The database is throwaway, so skip journaling and fsync as well.
+    @event.listens_for(sync_engine, "connect")
+    def _connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    @event.listens_for(sync_engine, "begin")
+    def _explicit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def engine():
+    """Create test database engine and schema once per module"""
+    test_engine = create_async_engine(TEST_DB_URL, echo=False)
+    _configure_sqlite(test_engine.sync_engine)
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield test_engine
+    await test_engine.dispose()
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def session(engine):
+    """Create test database session inside a transaction rolled back after the test"""
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        TestSessionLocal = async_sessionmaker(
+            bind=conn, class_=AsyncSession, expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        test_session = TestSessionLocal()
+        yield test_session
+        await test_session.close()
+        await trans.rollback()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def module_loop():
+    """The event loop the module's async fixtures run on (idle during sync tests)"""
+    return asyncio.get_running_loop()
+
+
+@pytest.fixture
+def query_counter(engine):
+    """Count SQL statements executed on the engine, ignoring transaction control"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not statement.startswith(("BEGIN", "SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK", "COMMIT")):
+            statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture(scope="module")
+def sync_engine():
+    """Create a synchronous test engine and schema once per module"""
+    test_engine = create_engine(
+        SYNC_TEST_DB_URL, echo=False,
+        poolclass=StaticPool, connect_args={"check_same_thread": False},
+    )
+    _configure_sqlite(test_engine)
+    Base.metadata.create_all(test_engine)
+    yield test_engine
+    test_engine.dispose()
+
+
+@pytest.fixture
+def sync_session(sync_engine):
+    """Create a synchronous session inside a transaction rolled back after the test"""
+    with sync_engine.connect() as conn:
+        trans = conn.begin()
+        TestSessionLocal = sessionmaker(
+            bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint"
+        )
+        test_session = TestSessionLocal()
+        yield test_session
+        test_session.close()
+        trans.rollback()
@@ -10,12 +10,13 @@ from database import SessionLocal
 from models import Teacher, Student, Lesson, RecurringPattern
 from services.recurring_service import RecurringLessonService
 from services.notification_service import NotificationService
+from services.notification_queue import notification_queue
 from handlers.recurring.constants import (
     CONVERT_SELECT_FREQUENCY, CONVERT_SELECT_END_DATE, CONVERT_CONFIRM,
     CONV_BACK_FREQ, CONV_BACK_END_DATE, CONV_BACK_LESSON,
     _append_back_button,
 )
-from bot.utils.helpers import safe_parse_callback_int
+from bot.utils.helpers import safe_parse_callback_int, match_callback_ints, CALENDAR_DAY_RE, MONTH_NAV_RE
 
 logger = logging.getLogger(__name__)
 
@@ -35,8 +36,7 @@ async def convert_to_recurring_start(query: CallbackQuery, state: FSMContext, se
         await state.clear()
         return
 
-    result = await session.execute(select(Lesson).filter_by(id=lesson_id))
-    lesson = result.scalar_one_or_none()
+    lesson = await session.get(Lesson, lesson_id)
     if not lesson or lesson.teacher_id != teacher.id:
         await query.message.edit_text("🔒 You can only convert your own lessons.")
         await state.clear()
@@ -84,13 +84,13 @@ async def convert_select_end_date(query: CallbackQuery, state: FSMContext, sessi
     """Handle end date selection for convert"""
     from bot.keyboards.calendar_kb import create_calendar
 
-    if query.data.startswith('CALENDAR-DAY-'):
-        _, date_info = query.data.split("CALENDAR-DAY-", 1)
-        year, month, day = map(int, date_info.split('-'))
+    day_parts = match_callback_ints(CALENDAR_DAY_RE, query.data)
+    nav_parts = match_callback_ints(MONTH_NAV_RE, query.data)
+    if day_parts:
+        year, month, day = day_parts
         await state.update_data(convert_end_date=date(year, month, day))
-    elif query.data.startswith('PREV-MONTH-') or query.data.startswith('NEXT-MONTH-'):
-        parts = query.data.split('-', 2)
-        year, month = map(int, parts[2].split('-'))
+    elif nav_parts:
+        year, month = nav_parts
         calendar_markup = create_calendar(year, month)
         extra_row = [
             InlineKeyboardButton(text="\u2b05\ufe0f Back", callback_data=CONV_BACK_FREQ),
@@ -112,8 +112,7 @@ async def convert_select_end_date(query: CallbackQuery, state: FSMContext, sessi
         return
     end_date = data.get('convert_end_date')
 
-    result = await session.execute(select(Lesson).filter_by(id=lesson_id))
-    lesson = result.scalar_one_or_none()
+    lesson = await session.get(Lesson, lesson_id)
     lesson_info = f"{lesson.date} {lesson.time.strftime('%H:%M')}" if lesson else "Unknown"
 
     end_text = f" until {end_date}" if end_date else " (no end date)"
@@ -158,8 +157,7 @@ async def convert_confirm(query: CallbackQuery, state: FSMContext, session) -> N
         return
     end_date = data.get('convert_end_date')
 
-    result = await session.execute(select(Lesson).filter_by(id=lesson_id))
-    lesson = result.scalar_one_or_none()
+    lesson = await session.get(Lesson, lesson_id)
     if not lesson or lesson.teacher_id != teacher.id:
         await query.message.edit_text("🔒 You can only convert your own lessons.")
         await state.clear()
@@ -182,7 +180,8 @@ async def convert_confirm(query: CallbackQuery, state: FSMContext, session) -> N
             result = await session.execute(select(Teacher).filter_by(telegram_id=query.from_user.id))
             teacher = result.scalar_one_or_none()
             if teacher:
-                await NotificationService.notify_student_recurring_created(
+                notification_queue.enqueue(
+                    NotificationService.notify_student_recurring_created,
                     query.bot, lesson.student, teacher, pattern
                 )
         await query.message.edit_text(f"\u2705 {message}")
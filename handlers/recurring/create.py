@@ -9,6 +9,7 @@ from database import SessionLocal
 from models import Teacher, Student, RecurringPattern
 from services.recurring_service import RecurringLessonService
 from services.notification_service import NotificationService
+from services.notification_queue import notification_queue
 from handlers.recurring.constants import (
     RECURRING_SELECT_STUDENT, RECURRING_SELECT_FREQUENCY, RECURRING_SELECT_WEEKDAY,
     RECURRING_SELECT_DAY_OF_MONTH, RECURRING_SELECT_TIME, RECURRING_SELECT_END_DATE,
@@ -17,7 +18,7 @@ from handlers.recurring.constants import (
     REC_BACK_TIME, REC_BACK_END_DATE,
     _append_back_button,
 )
-from bot.utils.helpers import safe_parse_callback_int
+from bot.utils.helpers import safe_parse_callback_int, match_callback_ints, CALENDAR_DAY_RE, MONTH_NAV_RE
 
 logger = logging.getLogger(__name__)
 
@@ -208,13 +209,13 @@ async def recurring_select_end_date(query: CallbackQuery, state: FSMContext, ses
     """Handle end date selection"""
     from bot.keyboards.calendar_kb import create_calendar
 
-    if query.data.startswith('CALENDAR-DAY-'):
-        _, date_info = query.data.split("CALENDAR-DAY-", 1)
-        year, month, day = map(int, date_info.split('-'))
+    day_parts = match_callback_ints(CALENDAR_DAY_RE, query.data)
+    nav_parts = match_callback_ints(MONTH_NAV_RE, query.data)
+    if day_parts:
+        year, month, day = day_parts
         await state.update_data(recurring_end_date=date(year, month, day))
-    elif query.data.startswith('PREV-MONTH-') or query.data.startswith('NEXT-MONTH-'):
-        parts = query.data.split('-', 2)
-        year, month = map(int, parts[2].split('-'))
+    elif nav_parts:
+        year, month = nav_parts
         calendar_markup = create_calendar(year, month)
         extra_row = [
             InlineKeyboardButton(text="\u2b05\ufe0f Back", callback_data=REC_BACK_TIME),
@@ -237,8 +238,7 @@ async def recurring_select_end_date(query: CallbackQuery, state: FSMContext, ses
         return
     end_date = data.get('recurring_end_date')
 
-    result = await session.execute(select(Student).filter_by(id=student_id))
-    student = result.scalar_one_or_none()
+    student = await session.get(Student, student_id)
     student_name = student.name if student else "Unknown"
 
     weekday_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
@@ -314,10 +314,10 @@ async def recurring_confirm(query: CallbackQuery, state: FSMContext, session) ->
         )
 
         if success:
-            result = await session.execute(select(Student).filter_by(id=student_id))
-            student = result.scalar_one_or_none()
+            student = await session.get(Student, student_id)
             if student:
-                await NotificationService.notify_student_recurring_created(
+                notification_queue.enqueue(
+                    NotificationService.notify_student_recurring_created,
                     query.bot, student, teacher, created_pattern
                 )
             await query.message.edit_text(f"\u2705 {message}")
@@ -8,6 +8,7 @@ from sqlalchemy.orm import selectinload
 from models import Teacher, Student, Lesson, RecurringPattern
 from services.recurring_service import RecurringLessonService
 from services.notification_service import NotificationService
+from services.notification_queue import notification_queue
 from bot.utils.helpers import safe_parse_callback_int
 
 logger = logging.getLogger(__name__)
@@ -20,8 +21,7 @@ async def smart_delete_lesson(query: CallbackQuery, state: FSMContext, session)
         await query.message.edit_text("⚠️ Invalid callback data. Please try again.")
         return
 
-    result = await session.execute(select(Lesson).filter_by(id=lesson_id))
-    lesson = result.scalar_one_or_none()
+    lesson = await session.get(Lesson, lesson_id)
 
     if not lesson:
         await query.message.edit_text("⚠️ Lesson not found.")
@@ -87,7 +87,8 @@ async def smart_delete_once(query: CallbackQuery, state: FSMContext, session) ->
 
     if success:
         if lesson.student:
-            await NotificationService.notify_student_lesson_cancelled(
+            notification_queue.enqueue(
+                NotificationService.notify_student_lesson_cancelled,
                 query.bot, lesson.student, teacher, lesson_date, lesson.time, is_single_instance=True
             )
         await query.message.edit_text("\u2705 Single lesson instance deleted.")
@@ -102,8 +103,7 @@ async def smart_delete_series(query: CallbackQuery, state: FSMContext, session)
         await query.message.edit_text("⚠️ Invalid callback data. Please try again.")
         return
 
-    result = await session.execute(select(RecurringPattern).filter_by(id=pattern_id))
-    pattern = result.scalar_one_or_none()
+    pattern = await session.get(RecurringPattern, pattern_id)
 
     if not pattern:
         await query.message.edit_text("⚠️ Pattern not found.")
@@ -122,10 +122,10 @@ async def smart_delete_series(query: CallbackQuery, state: FSMContext, session)
     )
 
     if success:
-        result = await session.execute(select(Student).filter_by(id=pattern.student_id))
-        student = result.scalar_one_or_none()
+        student = await session.get(Student, pattern.student_id)
         if student:
-            await NotificationService.notify_student_series_cancelled(
+            notification_queue.enqueue(
+                NotificationService.notify_student_series_cancelled,
                 query.bot, student, teacher, pattern
             )
         await query.message.edit_text("\u2705 Entire recurring series deleted.")
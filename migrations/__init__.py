@@ -9,6 +9,8 @@ from migrations.migrate_v8_json_content import migrate_v7_to_v8
 from migrations.migrate_v9_attempts import migrate_v8_to_v9
 from migrations.migrate_v10_payment_balance import migrate_v9_to_v10
 from migrations.migrate_v11_homework_marks import migrate_v10_to_v11
+from migrations.migrate_v12_student_slot_unique import migrate_v11_to_v12
+from migrations.migrate_v13_drop_redundant_lesson_indexes import migrate_v12_to_v13
 
 MIGRATIONS = {
     1: migrate_v1_to_v2,
@@ -21,4 +23,6 @@ MIGRATIONS = {
     8: migrate_v8_to_v9,
     9: migrate_v9_to_v10,
     10: migrate_v10_to_v11,
+    11: migrate_v11_to_v12,
+    12: migrate_v12_to_v13,
 }
@@ -0,0 +1,9 @@
+"""Migration errors"""
+
+
+class MigrationAborted(Exception):
+    """Raised when a migration needs manual intervention before it can run.
+
+    init_db stops at the failing version instead of skipping it, so the
+    migration is retried on the next start once the data has been fixed.
+    """
@@ -0,0 +1,51 @@
+"""Migration v11 -> v12: Add UNIQUE constraint on (student_id, date, time)
+
+Duplicate student slots are reported and the migration aborts: the rows may
+be paid lessons or referenced by homework and reschedule requests, so an
+operator has to decide which booking to keep.
+"""
+from sqlalchemy import text
+import logging
+
+from migrations.errors import MigrationAborted
+
+logger = logging.getLogger(__name__)
+
+
+async def find_duplicate_student_slots(conn) -> list:
+    """Return (student_id, date, time, lesson ids) for every double-booked student slot."""
+    result = await conn.execute(text("""
+        SELECT student_id, date, time, id FROM lessons
+        WHERE (student_id, date, time) IN (
+            SELECT student_id, date, time FROM lessons
+            GROUP BY student_id, date, time
+            HAVING COUNT(*) > 1
+        )
+        ORDER BY student_id, date, time, id
+    """))
+    slots = {}
+    for student_id, lesson_date, lesson_time, lesson_id in result.all():
+        slots.setdefault((student_id, lesson_date, lesson_time), []).append(lesson_id)
+    return [(*slot, ids) for slot, ids in slots.items()]
+
+
+async def migrate_v11_to_v12(conn) -> None:
+    """Create the student slot unique constraint, aborting on duplicate slots."""
+    duplicates = await find_duplicate_student_slots(conn)
+    if duplicates:
+        for student_id, lesson_date, lesson_time, ids in duplicates:
+            logger.error(
+                f"Student {student_id} has {len(ids)} lessons at {lesson_date} {lesson_time}: ids {ids}"
+            )
+        raise MigrationAborted(
+            f"{len(duplicates)} duplicate student lesson slot(s) found; resolve them and restart "
+            "to create uq_lesson_student_date_time"
+        )
+
+    try:
+        await conn.execute(text(
+            "CREATE UNIQUE INDEX IF NOT EXISTS uq_lesson_student_date_time ON lessons(student_id, date, time)"
+        ))
+        logger.info("Created UNIQUE constraint on lessons(student_id, date, time)")
+    except Exception as e:
+        logger.warning(f"UNIQUE constraint migration note: {e}")
@@ -0,0 +1,35 @@
+"""Migration v12 -> v13: Drop lesson indexes covered by the slot unique constraints"""
+from sqlalchemy import inspect, text
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Every one of these is a leading-column prefix of the unique index it maps to
+REDUNDANT_INDEXES = {
+    'idx_lessons_teacher': 'uq_lesson_teacher_date_time',
+    'idx_lessons_student': 'uq_lesson_student_date_time',
+    'idx_lessons_teacher_date': 'uq_lesson_teacher_date_time',
+    'idx_lessons_student_date': 'uq_lesson_student_date_time',
+}
+
+
+def _unique_lesson_indexes(sync_conn) -> set:
+    """Names of unique indexes/constraints on lessons, however they were created"""
+    inspector = inspect(sync_conn)
+    names = {ix['name'] for ix in inspector.get_indexes('lessons') if ix.get('unique')}
+    names.update(uc['name'] for uc in inspector.get_unique_constraints('lessons'))
+    return names
+
+
+async def migrate_v12_to_v13(conn) -> None:
+    """Drop single-column and (party, date) lesson indexes whose covering unique index exists."""
+    unique_indexes = await conn.run_sync(_unique_lesson_indexes)
+    for name, covered_by in REDUNDANT_INDEXES.items():
+        if covered_by not in unique_indexes:
+            logger.warning(f"Keeping index {name}: {covered_by} does not exist")
+            continue
+        try:
+            await conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+            logger.info(f"Dropped redundant index {name}")
+        except Exception as e:
+            logger.warning(f"Index {name} drop note: {e}")
@@ -61,14 +61,13 @@ class Lesson(Base):
     recurring_pattern = relationship("RecurringPattern", foreign_keys=[recurring_pattern_id], back_populates="lessons")
     
     __table_args__ = (
+        # The slot constraints double as the (teacher|student, date, time)
+        # lookup indexes for conflict checks and per-party date ranges
         UniqueConstraint('teacher_id', 'date', 'time', name='uq_lesson_teacher_date_time'),
+        UniqueConstraint('student_id', 'date', 'time', name='uq_lesson_student_date_time'),
         Index('idx_lessons_pattern', 'recurring_pattern_id', 'date'),
-        Index('idx_lessons_teacher_date', 'teacher_id', 'date'),
-        Index('idx_lessons_student_date', 'student_id', 'date'),
         Index('idx_lessons_homework_check', 'date', 'time', 'homework_prompt_sent_at'),
         Index('idx_lessons_is_paid', 'is_paid'),
-        Index('idx_lessons_teacher', 'teacher_id'),
-        Index('idx_lessons_student', 'student_id'),
     )
 
 
@@ -1,13 +1,50 @@
 """Lesson service - CRUD operations for single lessons"""
-from datetime import datetime, date, time, timezone
-from typing import Optional, List, Tuple
-from sqlalchemy import select
+from datetime import datetime, date, time, timedelta, timezone
+from time import monotonic
+from typing import NamedTuple, Optional, List, Tuple
+from sqlalchemy import select, update, delete, exists, or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from models import Lesson
+from sqlalchemy.orm import aliased, joinedload, selectinload
+from models import Lesson, Teacher, Student
 import logging
 
 logger = logging.getLogger(__name__)
 
+class CancelledLesson(NamedTuple):
+    """Values of a lesson row removed by cancel_lesson"""
+    id: int
+    teacher_id: int
+    student_id: int
+    date: date
+    time: time
+
+
+TODAY_CACHE_SECONDS = 60
+_today_cache: List = [None, 0.0]
+
+
+def _today() -> date:
+    """Current UTC date, recomputed at most every TODAY_CACHE_SECONDS and never across midnight"""
+    now = monotonic()
+    if now >= _today_cache[1]:
+        current = datetime.now(timezone.utc)
+        midnight = datetime.combine(current.date() + timedelta(days=1), time(), tzinfo=timezone.utc)
+        ttl = min(TODAY_CACHE_SECONDS, (midnight - current).total_seconds())
+        _today_cache[:] = [current.date(), now + ttl]
+    return _today_cache[0]
+
+
+def _slot_conflict_message(error: IntegrityError) -> Optional[str]:
+    """Map a slot unique-constraint violation to its user message"""
+    detail = str(error.orig)
+    # PostgreSQL names the constraint, SQLite lists its columns
+    if 'uq_lesson_teacher_date_time' in detail or 'lessons.teacher_id, lessons.date' in detail:
+        return "The teacher already has a lesson scheduled at this time"
+    if 'uq_lesson_student_date_time' in detail or 'lessons.student_id, lessons.date' in detail:
+        return "The student already has a lesson scheduled at this time"
+    return None
+
 
 class LessonService:
     """Lesson management service"""
@@ -17,27 +54,20 @@ class LessonService:
                            lesson_date: date, lesson_time: time,
                            exclude_lesson_id: Optional[int] = None) -> Tuple[bool, str]:
         """Check for time conflict"""
-        query_teacher = select(Lesson).filter(
-            Lesson.teacher_id == teacher_id,
-            Lesson.date == lesson_date,
-            Lesson.time == lesson_time
-        )
-        query_student = select(Lesson).filter(
-            Lesson.student_id == student_id,
-            Lesson.date == lesson_date,
-            Lesson.time == lesson_time
-        )
-
+        slot = [Lesson.date == lesson_date, Lesson.time == lesson_time]
         if exclude_lesson_id:
-            query_teacher = query_teacher.filter(Lesson.id != exclude_lesson_id)
-            query_student = query_student.filter(Lesson.id != exclude_lesson_id)
+            slot.append(Lesson.id != exclude_lesson_id)
 
-        result_teacher = await session.execute(query_teacher)
-        result_student = await session.execute(query_student)
-        
-        if result_teacher.scalar_one_or_none():
+        # One round trip returning two booleans; no Lesson rows are fetched
+        result = await session.execute(select(
+            exists().where(Lesson.teacher_id == teacher_id, *slot),
+            exists().where(Lesson.student_id == student_id, *slot),
+        ))
+        teacher_busy, student_busy = result.one()
+
+        if teacher_busy:
             return False, "The teacher already has a lesson scheduled at this time"
-        if result_student.scalar_one_or_none():
+        if student_busy:
             return False, "The student already has a lesson scheduled at this time"
 
         return True, ""
@@ -45,15 +75,13 @@ class LessonService:
     @staticmethod
     async def create_lesson(session: AsyncSession, teacher_id: int, student_id: int,
                      lesson_date: date, lesson_time: time) -> Tuple[bool, str, Optional[Lesson]]:
-        """Create lesson with validation"""
-        if lesson_date < datetime.now(timezone.utc).date():
-            return False, "Cannot schedule a lesson for a past date", None
+        """Create lesson with validation.
 
-        is_valid, error_msg = await LessonService.check_time_conflict(
-            session, teacher_id, student_id, lesson_date, lesson_time
-        )
-        if not is_valid:
-            return False, error_msg, None
+        The slot unique constraints are the conflict check: the INSERT runs in
+        a savepoint and a violation is translated into the usual message.
+        """
+        if lesson_date < _today():
+            return False, "Cannot schedule a lesson for a past date", None
 
         lesson = Lesson(
             date=lesson_date,
@@ -61,55 +89,154 @@ class LessonService:
             teacher_id=teacher_id,
             student_id=student_id
         )
-        session.add(lesson)
+        try:
+            async with session.begin_nested():
+                session.add(lesson)
+        except IntegrityError as e:
+            error_msg = _slot_conflict_message(e)
+            if error_msg is None:
+                raise
+            return False, error_msg, None
+        # The flush gets the id back through INSERT ... RETURNING and the
+        # sessions use expire_on_commit=False, so no reload is needed
         await session.commit()
-        await session.refresh(lesson)
 
         return True, "Lesson created successfully", lesson
     
+    @staticmethod
+    async def create_lessons(session: AsyncSession,
+                             items: List[Tuple[int, int, date, time]]
+                             ) -> Tuple[List[Lesson], List[Tuple[Tuple[int, int, date, time], str]]]:
+        """Create many lessons with one conflict query and one commit.
+
+        ``items`` are (teacher_id, student_id, date, time) tuples. Returns the
+        created lessons and the rejected items with the reason for each.
+        """
+        today = _today()
+        rejected = []
+        if not items:
+            return [], rejected
+
+        result = await session.execute(
+            select(Lesson.teacher_id, Lesson.student_id, Lesson.date, Lesson.time).filter(
+                Lesson.date.in_({item[2] for item in items}),
+                or_(
+                    Lesson.teacher_id.in_({item[0] for item in items}),
+                    Lesson.student_id.in_({item[1] for item in items}),
+                )
+            )
+        )
+        teacher_slots = set()
+        student_slots = set()
+        for teacher_id, student_id, lesson_date, lesson_time in result.all():
+            teacher_slots.add((teacher_id, lesson_date, lesson_time))
+            student_slots.add((student_id, lesson_date, lesson_time))
+
+        lessons = []
+        for item in items:
+            teacher_id, student_id, lesson_date, lesson_time = item
+            if lesson_date < today:
+                rejected.append((item, "Cannot schedule a lesson for a past date"))
+                continue
+            if (teacher_id, lesson_date, lesson_time) in teacher_slots:
+                rejected.append((item, "The teacher already has a lesson scheduled at this time"))
+                continue
+            if (student_id, lesson_date, lesson_time) in student_slots:
+                rejected.append((item, "The student already has a lesson scheduled at this time"))
+                continue
+            # Later items in the same batch must not collide with this one
+            teacher_slots.add((teacher_id, lesson_date, lesson_time))
+            student_slots.add((student_id, lesson_date, lesson_time))
+            lessons.append(Lesson(
+                date=lesson_date,
+                time=lesson_time,
+                teacher_id=teacher_id,
+                student_id=student_id
+            ))
+
+        if lessons:
+            session.add_all(lessons)
+            await session.commit()
+
+        return lessons, rejected
+    
     @staticmethod
     async def reschedule_lesson(session: AsyncSession, lesson_id: int, new_time: time) -> Tuple[bool, str]:
         """Reschedule lesson"""
-        result = await session.execute(select(Lesson).filter_by(id=lesson_id))
-        lesson = result.scalar_one_or_none()
-        if not lesson:
+        # Fast path: one conditional UPDATE that only matches a future lesson
+        # whose new slot is free for both its teacher and its student
+        other = aliased(Lesson)
+        result = await session.execute(
+            update(Lesson)
+            .where(
+                Lesson.id == lesson_id,
+                Lesson.date >= _today(),
+                ~exists().where(
+                    other.id != Lesson.id,
+                    other.date == Lesson.date,
+                    other.time == new_time,
+                    or_(other.teacher_id == Lesson.teacher_id, other.student_id == Lesson.student_id),
+                ),
+            )
+            .values(time=new_time)
+            .execution_options(synchronize_session='fetch')
+        )
+        if result.rowcount:
+            await session.commit()
+            return True, "Lesson rescheduled successfully"
+
+        # Slow path: work out which condition failed
+        result = await session.execute(
+            select(Lesson.teacher_id, Lesson.student_id, Lesson.date).filter_by(id=lesson_id)
+        )
+        row = result.first()
+        if row is None:
             return False, "Lesson not found"
 
-        if lesson.date < datetime.now(timezone.utc).date():
+        teacher_id, student_id, lesson_date = row
+        if lesson_date < _today():
             return False, "Cannot reschedule a lesson in the past"
 
         is_valid, error_msg = await LessonService.check_time_conflict(
-            session, lesson.teacher_id, lesson.student_id,
-            lesson.date, new_time, exclude_lesson_id=lesson_id
+            session, teacher_id, student_id,
+            lesson_date, new_time, exclude_lesson_id=lesson_id
         )
-        if not is_valid:
-            return False, error_msg
-
-        lesson.time = new_time
-        await session.commit()
-
-        return True, "Lesson rescheduled successfully"
+        return False, error_msg or "The lesson could not be rescheduled, please try again"
     
     @staticmethod
-    async def cancel_lesson(session: AsyncSession, lesson_id: int) -> Tuple[bool, str, Optional[Lesson]]:
-        """Cancel lesson"""
-        result = await session.execute(select(Lesson).filter_by(id=lesson_id))
-        lesson = result.scalar_one_or_none()
-        if not lesson:
+    async def cancel_lesson(session: AsyncSession, lesson_id: int) -> Tuple[bool, str, Optional[CancelledLesson]]:
+        """Cancel lesson, returning the deleted row's values"""
+        result = await session.execute(
+            delete(Lesson).where(Lesson.id == lesson_id).returning(
+                Lesson.id, Lesson.teacher_id, Lesson.student_id, Lesson.date, Lesson.time
+            )
+        )
+        row = result.first()
+        if row is None:
             return False, "Lesson not found", None
-
-        lesson_copy = lesson
-        await session.delete(lesson)
         await session.commit()
 
-        return True, "Lesson cancelled", lesson_copy
+        return True, "Lesson cancelled", CancelledLesson(*row)
     
+    @staticmethod
+    async def get_lesson_with_parties(session: AsyncSession, lesson_id: int) -> Optional[Lesson]:
+        """Get a lesson with the teacher and student fields notifications need, in one query"""
+        result = await session.execute(
+            select(Lesson).options(
+                joinedload(Lesson.teacher, innerjoin=True).load_only(Teacher.name, Teacher.telegram_id),
+                joinedload(Lesson.student, innerjoin=True).load_only(Student.name, Student.telegram_id),
+            ).filter(Lesson.id == lesson_id)
+        )
+        return result.scalar_one_or_none()
+
     @staticmethod
     async def get_future_lessons(session: AsyncSession, student_id: int) -> List[Lesson]:
-        """Get future lessons for a student"""
-        today = datetime.now(timezone.utc).date()
+        """Get future lessons for a student, with teacher and student loaded"""
+        today = _today()
         result = await session.execute(
-            select(Lesson).filter(
+            select(Lesson).options(
+                selectinload(Lesson.teacher), selectinload(Lesson.student)
+            ).filter(
                 Lesson.student_id == student_id,
                 Lesson.date >= today
             ).order_by(Lesson.date, Lesson.time)
@@ -118,11 +245,37 @@ class LessonService:
     
     @staticmethod
     async def get_lessons_by_date(session: AsyncSession, teacher_id: int, lesson_date: date) -> List[Lesson]:
-        """Get lessons for a teacher on a specific date"""
+        """Get lessons for a teacher on a specific date, with teacher and student loaded"""
         result = await session.execute(
-            select(Lesson).filter(
+            select(Lesson).options(
+                selectinload(Lesson.teacher), selectinload(Lesson.student)
+            ).filter(
                 Lesson.teacher_id == teacher_id,
                 Lesson.date == lesson_date
             ).order_by(Lesson.time)
         )
         return result.scalars().all()
+
+    @staticmethod
+    async def get_teacher_schedule(session: AsyncSession, teacher_id: int) -> List[Tuple[date, time, Optional[str]]]:
+        """Get (date, time, student name) rows for a teacher's upcoming lessons"""
+        today = _today()
+        result = await session.execute(
+            select(Lesson.date, Lesson.time, Student.name)
+            .outerjoin(Student, Lesson.student_id == Student.id)
+            .where(Lesson.teacher_id == teacher_id, Lesson.date >= today)
+            .order_by(Lesson.date, Lesson.time)
+        )
+        return result.all()
+
+    @staticmethod
+    async def get_student_schedule(session: AsyncSession, student_id: int) -> List[Tuple[date, time, str]]:
+        """Get (date, time, teacher name) rows for a student's upcoming lessons"""
+        today = _today()
+        result = await session.execute(
+            select(Lesson.date, Lesson.time, Teacher.name)
+            .join(Teacher, Lesson.teacher_id == Teacher.id)
+            .where(Lesson.student_id == student_id, Lesson.date >= today)
+            .order_by(Lesson.date, Lesson.time)
+        )
+        return result.all()
@@ -0,0 +1,85 @@
+"""Notification queue - Send Telegram notifications off the handler path
+
+Handlers enqueue NotificationService calls instead of awaiting them, so the
+update finishes (and its DB session commits) without waiting for the
+Telegram API round-trip. A few worker tasks drain the queue in the
+background. The queue is bounded; when it is full the notification is
+dropped and logged rather than blocking the handler.
+
+Sends made while ``fanout_send`` is True (queue workers, background jobs)
+are paced by OutgoingRateLimitMiddleware; interactive handler replies are not.
+"""
+import asyncio
+import logging
+import os
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_QUEUE_MAXSIZE = int(os.getenv('NOTIFY_QUEUE_MAXSIZE', '1000'))
+NOTIFY_WORKERS = int(os.getenv('NOTIFY_WORKERS', '2'))
+
+fanout_send: ContextVar[bool] = ContextVar('fanout_send', default=False)
+
+
+class NotificationQueue:
+    """Bounded asyncio queue of notification coroutines with worker tasks"""
+
+    def __init__(self, maxsize: int = NOTIFY_QUEUE_MAXSIZE, workers: int = NOTIFY_WORKERS):
+        self.maxsize = maxsize
+        self.workers = workers
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        """Spawn the worker tasks on the running event loop."""
+        if self.running:
+            logger.warning("Notification queue already running")
+            return
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        logger.info(f"Notification queue started ({self.workers} workers, max {self.maxsize})")
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Give pending notifications a chance to go out, then stop the workers."""
+        if self._queue is not None and self.running:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Dropping {self._queue.qsize()} pending notifications on shutdown")
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("Notification queue stopped")
+
+    def enqueue(self, fn: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> bool:
+        """Queue ``fn(*args, **kwargs)`` for sending. Returns False if dropped."""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+        try:
+            self._queue.put_nowait((fn, args, kwargs))
+            return True
+        except asyncio.QueueFull:
+            logger.error(f"Notification queue full, dropping {getattr(fn, '__name__', fn)}")
+            return False
+
+    async def _worker(self) -> None:
+        fanout_send.set(True)
+        while True:
+            fn, args, kwargs = await self._queue.get()
+            try:
+                await fn(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"Error sending queued notification {getattr(fn, '__name__', fn)}: {e}")
+            finally:
+                self._queue.task_done()
+
+
+notification_queue = NotificationQueue()
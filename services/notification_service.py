@@ -6,6 +6,18 @@ import re
 
 logger = logging.getLogger(__name__)
 
+LESSON_CREATED = "You have a lesson scheduled with {teacher} on {date} at {hm}."
+LESSON_CANCELLED = "The lesson with {teacher} on {date} at {hm} has been cancelled."
+LESSON_CANCELLED_SINGLE = (LESSON_CANCELLED + " This is a single cancellation - "
+                           "other lessons in the series remain scheduled.")
+RESCHEDULE_ACCEPTED = "Your lesson with {teacher} has been rescheduled to {date} at {hm}."
+RESCHEDULE_DECLINED = "Your request to reschedule the lesson with {teacher} was declined."
+
+
+def _fmt_hm(t: time) -> str:
+    """HH:MM for a time, without going through strftime"""
+    return f"{t.hour:02d}:{t.minute:02d}"
+
 
 def _sanitize_text(text: str) -> str:
     """Sanitize text to prevent XSS when displayed with parse_mode=HTML."""
@@ -30,7 +42,7 @@ class NotificationService:
         try:
             await bot.send_message(
                 chat_id=student.telegram_id,
-                text=f"You have a lesson scheduled with {teacher.name} on {lesson_date} at {lesson_time.strftime('%H:%M')}."
+                text=LESSON_CREATED.format(teacher=teacher.name, date=lesson_date, hm=_fmt_hm(lesson_time))
             )
             return True
         except Exception as e:
@@ -46,12 +58,8 @@ class NotificationService:
             return False
 
         try:
-            if is_single_instance:
-                text = (f"The lesson with {teacher.name} on {lesson_date} at "
-                        f"{lesson_time.strftime('%H:%M')} has been cancelled. "
-                        f"This is a single cancellation - other lessons in the series remain scheduled.")
-            else:
-                text = f"The lesson with {teacher.name} on {lesson_date} at {lesson_time.strftime('%H:%M')} has been cancelled."
+            template = LESSON_CANCELLED_SINGLE if is_single_instance else LESSON_CANCELLED
+            text = template.format(teacher=teacher.name, date=lesson_date, hm=_fmt_hm(lesson_time))
             await bot.send_message(
                 chat_id=student.telegram_id,
                 text=text
@@ -86,7 +94,7 @@ class NotificationService:
             end_text = f" until {pattern.end_date}" if pattern.end_date else ""
 
             text = (f"A recurring lesson has been scheduled with {teacher.name}:\n"
-                    f"{freq_text} at {pattern.time.strftime('%H:%M')}{end_text}")
+                    f"{freq_text} at {_fmt_hm(pattern.time)}{end_text}")
 
             await bot.send_message(
                 chat_id=student.telegram_id,
@@ -126,9 +134,9 @@ class NotificationService:
 
         try:
             if accepted:
-                text = f"Your lesson with {teacher.name} has been rescheduled to {lesson_date} at {new_time.strftime('%H:%M')}."
+                text = RESCHEDULE_ACCEPTED.format(teacher=teacher.name, date=lesson_date, hm=_fmt_hm(new_time))
             else:
-                text = f"Your request to reschedule the lesson with {teacher.name} was declined."
+                text = RESCHEDULE_DECLINED.format(teacher=teacher.name)
 
             await bot.send_message(chat_id=student.telegram_id, text=text)
             return True
@@ -147,7 +155,7 @@ class NotificationService:
         try:
             await bot.send_message(
                 chat_id=teacher.telegram_id,
-                text=f"Student {student.name} requests to reschedule the lesson from {lesson.time.strftime('%H:%M')} to {new_hour}:00 for reason: {_sanitize_text(reason)}. Do you agree?",
+                text=f"Student {student.name} requests to reschedule the lesson from {_fmt_hm(lesson.time)} to {new_hour}:00 for reason: {_sanitize_text(reason)}. Do you agree?",
                 reply_markup=keyboard
             )
             return True
@@ -166,8 +174,8 @@ class NotificationService:
 
         try:
             text = (f"📅 Reschedule Request from {student.name}\n\n"
-                    f"OLD: {original_date} {original_time.strftime('%H:%M')}\n"
-                    f"NEW: {requested_date} {requested_time.strftime('%H:%M')}\n\n"
+                    f"OLD: {original_date} {_fmt_hm(original_time)}\n"
+                    f"NEW: {requested_date} {_fmt_hm(requested_time)}\n\n"
                     f"Reason: {_sanitize_text(reason)}\n\n"
                     f"Please approve or decline.")
 
@@ -5,7 +5,7 @@ from datetime import datetime, date, timedelta, timezone
 from typing import Optional, List, Tuple
 from sqlalchemy import select, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager, selectinload
 
 from models import Lesson, Student, PaymentTransaction
 
@@ -31,8 +31,7 @@ class _LessonOpsMixin:
         note: Optional[str] = None
     ) -> Tuple[bool, str, Optional[Lesson]]:
         try:
-            result = await session.execute(select(Lesson).filter_by(id=lesson_id))
-            lesson = result.scalar_one_or_none()
+            lesson = await session.get(Lesson, lesson_id)
             if not lesson:
                 return False, "Lesson not found", None
             lesson.is_paid = True
@@ -55,8 +54,7 @@ class _LessonOpsMixin:
         lesson_id: int
     ) -> Tuple[bool, str, Optional[Lesson]]:
         try:
-            result = await session.execute(select(Lesson).filter_by(id=lesson_id))
-            lesson = result.scalar_one_or_none()
+            lesson = await session.get(Lesson, lesson_id)
             if not lesson:
                 return False, "Lesson not found", None
             lesson.is_paid = False
@@ -176,8 +174,7 @@ class _LessonOpsMixin:
         note: str
     ) -> Tuple[bool, str]:
         try:
-            result = await session.execute(select(Lesson).filter_by(id=lesson_id))
-            lesson = result.scalar_one_or_none()
+            lesson = await session.get(Lesson, lesson_id)
             if not lesson:
                 return False, "Lesson not found"
             lesson.payment_note = _sanitize_note(note)
@@ -196,8 +193,7 @@ class _LessonOpsMixin:
         enabled: bool
     ) -> Tuple[bool, str]:
         try:
-            result = await session.execute(select(Student).filter_by(id=student_id))
-            student = result.scalar_one_or_none()
+            student = await session.get(Student, student_id)
             if not student:
                 return False, "Student not found"
             student.payment_reminders_enabled = enabled
@@ -221,8 +217,11 @@ class _LessonOpsMixin:
             after_time = now - timedelta(hours=hours_after)
             result = await session.execute(
                 select(Lesson)
-                .options(selectinload(Lesson.student), selectinload(Lesson.teacher))
+                .join(Lesson.student)
+                .options(contains_eager(Lesson.student), selectinload(Lesson.teacher))
                 .filter(and_(
+                    Student.telegram_id.isnot(None),
+                    Student.payment_reminders_enabled.is_(True),
                     Lesson.is_paid.is_(False),
                     Lesson.payment_reminder_sent_at.is_(None),
                     or_(
@@ -250,8 +249,7 @@ class _LessonOpsMixin:
         lesson_id: int
     ) -> bool:
         try:
-            result = await session.execute(select(Lesson).filter_by(id=lesson_id))
-            lesson = result.scalar_one_or_none()
+            lesson = await session.get(Lesson, lesson_id)
             if not lesson:
                 return False
             lesson.payment_reminder_sent_at = datetime.now(timezone.utc)
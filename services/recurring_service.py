@@ -78,8 +78,7 @@ class RecurringLessonService:
         pattern_config: dict
     ) -> Tuple[bool, str, Optional[RecurringPattern]]:
         """Convert a single lesson to a recurring lesson."""
-        result = await session.execute(select(Lesson).filter_by(id=lesson_id))
-        lesson = result.scalar_one_or_none()
+        lesson = await session.get(Lesson, lesson_id)
         
         if lesson is None:
             return False, "Lesson not found", None
@@ -126,8 +125,7 @@ class RecurringLessonService:
         lesson_date: date
     ) -> Tuple[bool, str]:
         """Delete a single instance of a recurring lesson."""
-        result = await session.execute(select(Lesson).filter_by(id=lesson_id))
-        lesson = result.scalar_one_or_none()
+        lesson = await session.get(Lesson, lesson_id)
         
         if lesson is None:
             return False, "Lesson not found"
@@ -164,8 +162,7 @@ class RecurringLessonService:
         pattern_id: int
     ) -> Tuple[bool, str]:
         """Delete an entire recurring lesson series."""
-        result = await session.execute(select(RecurringPattern).filter_by(id=pattern_id))
-        pattern = result.scalar_one_or_none()
+        pattern = await session.get(RecurringPattern, pattern_id)
         
         if pattern is None:
             return False, "Recurring pattern not found"
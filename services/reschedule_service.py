@@ -111,8 +111,7 @@ class RescheduleService:
             return False, f"Request has already been {request.status}", None
         
         try:
-            result = await session.execute(select(Lesson).filter_by(id=request.lesson_id))
-            lesson = result.scalar_one_or_none()
+            lesson = await session.get(Lesson, request.lesson_id)
             
             if not lesson:
                 return False, "Lesson not found", None
@@ -147,8 +146,7 @@ class RescheduleService:
         request_id: int
     ) -> Tuple[bool, str]:
         """Decline a reschedule request."""
-        result = await session.execute(select(RescheduleRequest).filter_by(id=request_id))
-        request = result.scalar_one_or_none()
+        request = await session.get(RescheduleRequest, request_id)
         
         if not request:
             return False, "Reschedule request not found"
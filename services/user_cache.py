@@ -0,0 +1,252 @@
+"""User cache - In-process telegram_id -> teacher/student id lookups
+
+Almost every update starts by resolving the sender's Telegram id to a
+teacher or student row. The mapping only changes on registration and
+deletion, so the primary keys are cached here with a short TTL. ORM objects
+are never cached: they belong to the session that loaded them.
+
+Ids from get_teacher_id/get_student_id are not re-checked against the
+database on a hit, so after a deletion in another process they can be stale
+for up to the in-process TTL. They only gate menus and read-only views; any
+handler that writes rows for the user resolves it through
+UserService.get_teacher_by_telegram_id / get_student_by_telegram_id, which
+verify the row's telegram_id.
+
+Teacher rosters (the student picker and list) are cached the same way as
+plain (id, name, contact_info) rows and dropped whenever a student is added,
+registered or deleted.
+
+When REDIS_URL is set and the ``redis`` package is installed, Redis is used
+as a shared second tier behind the in-process dicts. Invalidations delete
+the Redis key (and are awaited), but another process's in-process entry
+cannot be reached, so with Redis the in-process TTL drops to
+SHARED_L1_TTL_SECONDS: other processes see a registration or deletion within
+a few seconds instead of after USER_CACHE_TTL_SECONDS. Redis errors are
+logged and fall through to the database.
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Hashable, NamedTuple, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from models import Teacher, Student
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+USER_CACHE_MAXSIZE = 10000
+USER_CACHE_TTL_SECONDS = 300
+SHARED_L1_TTL_SECONDS = 5
+ROSTER_CACHE_MAXSIZE = 1000
+
+REDIS_URL = os.getenv('REDIS_URL', '')
+
+
+class TTLCache:
+    """Small LRU dict whose entries expire ``ttl`` seconds after being set"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_teacher_ids = TTLCache(USER_CACHE_MAXSIZE, USER_CACHE_TTL_SECONDS)
+_student_ids = TTLCache(USER_CACHE_MAXSIZE, USER_CACHE_TTL_SECONDS)
+_rosters = TTLCache(ROSTER_CACHE_MAXSIZE, USER_CACHE_TTL_SECONDS)
+
+
+class RosterEntry(NamedTuple):
+    """Detached student row used to build roster keyboards"""
+    id: int
+    name: str
+    contact_info: Optional[str]
+
+
+if REDIS_URL and aioredis is None:
+    logger.warning("REDIS_URL is set but the redis package is not installed; using in-process cache only")
+_redis = aioredis.from_url(REDIS_URL, decode_responses=True) if REDIS_URL and aioredis else None
+_pending: set = set()
+
+
+def _teacher_key(telegram_id: int) -> str:
+    return f"tg:teacher:{telegram_id}"
+
+
+def _student_key(telegram_id: int) -> str:
+    return f"tg:student:{telegram_id}"
+
+
+def _roster_key(teacher_id: int) -> str:
+    return f"roster:{teacher_id}"
+
+
+async def _shared_get(key: str) -> Optional[str]:
+    if _redis is None:
+        return None
+    try:
+        return await _redis.get(key)
+    except Exception as e:
+        logger.warning(f"Redis get {key} failed: {e}")
+        return None
+
+
+def _l1_ttl() -> float:
+    """In-process TTL: short when Redis is shared, since peers can't evict our entries"""
+    return SHARED_L1_TTL_SECONDS if _redis is not None else USER_CACHE_TTL_SECONDS
+
+
+async def _swallow(op: Awaitable[Any]) -> None:
+    try:
+        await op
+    except Exception as e:
+        logger.warning(f"Redis write failed: {e}")
+
+
+def _shared_fire(make_op) -> None:
+    """Run a Redis write in the background so sync callers never wait on it"""
+    if _redis is None:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    task = loop.create_task(_swallow(make_op(_redis)))
+    _pending.add(task)
+    task.add_done_callback(_pending.discard)
+
+
+def remember_teacher(telegram_id: int, teacher_id: int) -> None:
+    """Store a known telegram_id -> teacher id mapping"""
+    _teacher_ids.set(telegram_id, teacher_id, _l1_ttl())
+    _shared_fire(lambda r: r.set(_teacher_key(telegram_id), teacher_id, ex=USER_CACHE_TTL_SECONDS))
+
+
+def remember_student(telegram_id: int, student_id: int) -> None:
+    """Store a known telegram_id -> student id mapping"""
+    _student_ids.set(telegram_id, student_id, _l1_ttl())
+    _shared_fire(lambda r: r.set(_student_key(telegram_id), student_id, ex=USER_CACHE_TTL_SECONDS))
+
+
+def cached_teacher_id(telegram_id: int) -> Optional[int]:
+    """Return the cached teacher id without touching the database"""
+    return _teacher_ids.get(telegram_id)
+
+
+def cached_student_id(telegram_id: int) -> Optional[int]:
+    """Return the cached student id without touching the database"""
+    return _student_ids.get(telegram_id)
+
+
+async def get_teacher_id(session: AsyncSession, telegram_id: int) -> Optional[int]:
+    """Get teacher id by telegram_id, querying only on cache miss"""
+    teacher_id = _teacher_ids.get(telegram_id)
+    if teacher_id is None:
+        shared = await _shared_get(_teacher_key(telegram_id))
+        if shared is not None:
+            teacher_id = int(shared)
+            _teacher_ids.set(telegram_id, teacher_id, _l1_ttl())
+            return teacher_id
+        result = await session.execute(select(Teacher.id).filter_by(telegram_id=telegram_id))
+        teacher_id = result.scalar_one_or_none()
+        if teacher_id is not None:
+            remember_teacher(telegram_id, teacher_id)
+    return teacher_id
+
+
+async def get_student_id(session: AsyncSession, telegram_id: int) -> Optional[int]:
+    """Get student id by telegram_id, querying only on cache miss"""
+    student_id = _student_ids.get(telegram_id)
+    if student_id is None:
+        shared = await _shared_get(_student_key(telegram_id))
+        if shared is not None:
+            student_id = int(shared)
+            _student_ids.set(telegram_id, student_id, _l1_ttl())
+            return student_id
+        result = await session.execute(select(Student.id).filter_by(telegram_id=telegram_id))
+        student_id = result.scalar_one_or_none()
+        if student_id is not None:
+            remember_student(telegram_id, student_id)
+    return student_id
+
+
+async def invalidate_user(telegram_id: Optional[int]) -> None:
+    """Drop cached ids for a telegram_id after registration or deletion"""
+    if telegram_id is None:
+        return
+    _teacher_ids.pop(telegram_id)
+    _student_ids.pop(telegram_id)
+    if _redis is not None:
+        await _swallow(_redis.delete(_teacher_key(telegram_id), _student_key(telegram_id)))
+
+
+async def get_roster(session: AsyncSession, teacher_id: int) -> tuple[RosterEntry, ...]:
+    """Get a teacher's students ordered by name, querying only on cache miss"""
+    roster = _rosters.get(teacher_id)
+    if roster is None:
+        shared = await _shared_get(_roster_key(teacher_id))
+        if shared is not None:
+            roster = tuple(RosterEntry(*row) for row in json.loads(shared))
+            _rosters.set(teacher_id, roster, _l1_ttl())
+            return roster
+        result = await session.execute(
+            select(Student.id, Student.name, Student.contact_info)
+            .filter_by(teacher_id=teacher_id)
+            .order_by(Student.name, Student.id)
+        )
+        roster = tuple(RosterEntry(*row) for row in result.all())
+        _rosters.set(teacher_id, roster, _l1_ttl())
+        payload = json.dumps(roster)
+        _shared_fire(lambda r: r.set(_roster_key(teacher_id), payload, ex=USER_CACHE_TTL_SECONDS))
+    return roster
+
+
+async def invalidate_roster(teacher_id: Optional[int]) -> None:
+    """Drop a teacher's cached roster after a student is added or removed"""
+    if teacher_id is None:
+        return
+    _rosters.pop(teacher_id)
+    if _redis is not None:
+        await _swallow(_redis.delete(_roster_key(teacher_id)))
+
+
+def clear_user_cache() -> None:
+    """Drop every in-process cached mapping"""
+    _teacher_ids.clear()
+    _student_ids.clear()
+    _rosters.clear()
@@ -3,6 +3,9 @@ from typing import Optional, List
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from models import Teacher, Student
+from services.user_cache import (
+    cached_teacher_id, cached_student_id, remember_teacher, remember_student, invalidate_user,
+)
 
 
 class UserService:
@@ -10,15 +13,35 @@ class UserService:
 
     @staticmethod
     async def get_teacher_by_telegram_id(session: AsyncSession, telegram_id: int) -> Optional[Teacher]:
-        """Get teacher by telegram_id"""
+        """Get teacher by telegram_id (PK lookup when the id is cached)"""
+        teacher_id = cached_teacher_id(telegram_id)
+        if teacher_id is not None:
+            teacher = await session.get(Teacher, teacher_id)
+            # The id may be stale (deleted elsewhere, or the rowid reused)
+            if teacher is not None and teacher.telegram_id == telegram_id:
+                return teacher
+            await invalidate_user(telegram_id)
         result = await session.execute(select(Teacher).filter_by(telegram_id=telegram_id))
-        return result.scalar_one_or_none()
+        teacher = result.scalar_one_or_none()
+        if teacher is not None:
+            remember_teacher(telegram_id, teacher.id)
+        return teacher
 
     @staticmethod
     async def get_student_by_telegram_id(session: AsyncSession, telegram_id: int) -> Optional[Student]:
-        """Get student by telegram_id"""
+        """Get student by telegram_id (PK lookup when the id is cached)"""
+        student_id = cached_student_id(telegram_id)
+        if student_id is not None:
+            student = await session.get(Student, student_id)
+            # The id may be stale (deleted elsewhere, or the rowid reused)
+            if student is not None and student.telegram_id == telegram_id:
+                return student
+            await invalidate_user(telegram_id)
         result = await session.execute(select(Student).filter_by(telegram_id=telegram_id))
-        return result.scalar_one_or_none()
+        student = result.scalar_one_or_none()
+        if student is not None:
+            remember_student(telegram_id, student.id)
+        return student
 
     @staticmethod
     async def get_teacher_students(session: AsyncSession, teacher_id: int) -> List[Student]:
@@ -12,26 +12,6 @@ from access_control import AccessControlService
 TEST_DB_URL = 'sqlite+aiosqlite:///:memory:'
 
 
-@pytest_asyncio.fixture
-async def engine():
-    """Create test database engine"""
-    test_engine = create_async_engine(TEST_DB_URL, echo=False)
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    yield test_engine
-    await test_engine.dispose()
-
-
-@pytest_asyncio.fixture
-async def session(engine):
-    """Create test database session"""
-    TestSessionLocal = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
-    test_session = TestSessionLocal()
-    yield test_session
-    await test_session.rollback()
-    await test_session.close()
-
-
 @pytest_asyncio.fixture
 async def teacher(session):
     """Create test teacher"""
@@ -43,7 +23,6 @@ async def teacher(session):
     )
     session.add(teacher)
     await session.commit()
-    await session.refresh(teacher)
     return teacher
 
 
@@ -58,7 +37,6 @@ async def another_teacher(session):
     )
     session.add(teacher)
     await session.commit()
-    await session.refresh(teacher)
     return teacher
 
 
@@ -73,7 +51,6 @@ async def student(session, teacher):
     )
     session.add(student)
     await session.commit()
-    await session.refresh(student)
     return student
 
 
@@ -88,7 +65,6 @@ async def lesson(session, teacher, student):
     )
     session.add(lesson)
     await session.commit()
-    await session.refresh(lesson)
     return lesson
 
 
@@ -107,10 +83,10 @@ async def recurring_pattern(session, teacher, student):
     )
     session.add(pattern)
     await session.commit()
-    await session.refresh(pattern)
     return pattern
 
 
+@pytest.mark.slow
 class TestAccessControlPropertyTests:
     """Property 3: Access Control Invariant - a teacher can delete a lesson only if lesson.teacher_id = teacher_id
     
@@ -142,8 +118,7 @@ class TestAccessControlPropertyTests:
                 telegram_id=teacher_id * 10000 + 1000000  # Ensure uniqueness
             )
             session.add(teacher1)
-            await session.commit()
-            await session.refresh(teacher1)
+            await session.flush()
             
             # Only create teacher2 if different from teacher1
             if teacher_id != lesson_teacher_id:
@@ -154,8 +129,7 @@ class TestAccessControlPropertyTests:
                     telegram_id=lesson_teacher_id * 10000 + 2000000  # Ensure uniqueness
                 )
                 session.add(teacher2)
-                await session.commit()
-                await session.refresh(teacher2)
+                await session.flush()
             else:
                 teacher2 = teacher1
             
@@ -167,8 +141,7 @@ class TestAccessControlPropertyTests:
                 telegram_id=999999
             )
             session.add(student)
-            await session.commit()
-            await session.refresh(student)
+            await session.flush()
             
             # Create lesson owned by teacher2
             lesson = Lesson(
@@ -179,7 +152,6 @@ class TestAccessControlPropertyTests:
             )
             session.add(lesson)
             await session.commit()
-            await session.refresh(lesson)
             
             # Test access control
             can_access, error = await AccessControlService.verify_teacher_owns_lesson(
@@ -226,8 +198,7 @@ class TestAccessControlPropertyTests:
                 telegram_id=teacher_id * 10000 + 3000000  # Ensure uniqueness
             )
             session.add(teacher1)
-            await session.commit()
-            await session.refresh(teacher1)
+            await session.flush()
             
             # Only create teacher2 if different from teacher1
             if teacher_id != pattern_teacher_id:
@@ -238,8 +209,7 @@ class TestAccessControlPropertyTests:
                     telegram_id=pattern_teacher_id * 10000 + 4000000  # Ensure uniqueness
                 )
                 session.add(teacher2)
-                await session.commit()
-                await session.refresh(teacher2)
+                await session.flush()
             else:
                 teacher2 = teacher1
             
@@ -251,8 +221,7 @@ class TestAccessControlPropertyTests:
                 telegram_id=999999
             )
             session.add(student)
-            await session.commit()
-            await session.refresh(student)
+            await session.flush()
             
             # Create pattern owned by teacher2
             pattern = RecurringPattern(
@@ -267,7 +236,6 @@ class TestAccessControlPropertyTests:
             )
             session.add(pattern)
             await session.commit()
-            await session.refresh(pattern)
             
             # Test access control
             can_access, error = await AccessControlService.verify_teacher_owns_pattern(
@@ -391,22 +359,20 @@ class TestAccessControlEdgeCases:
     async def test_multiple_lessons_same_teacher(self, session, teacher, student):
         """Test that teacher can access all their lessons"""
         # Create multiple lessons
-        lessons = []
-        for i in range(3):
-            lesson = Lesson(
+        lessons = [
+            Lesson(
                 date=date(2024, 6, 15 + i),
                 time=time(15, 0),
                 teacher_id=teacher.id,
                 student_id=student.id
             )
-            session.add(lesson)
-            lessons.append(lesson)
-        
+            for i in range(3)
+        ]
+        session.add_all(lessons)
         await session.commit()
         
         # Verify teacher can access all lessons
         for lesson in lessons:
-            await session.refresh(lesson)
             can_access, error = await AccessControlService.verify_teacher_owns_lesson(
                 session, teacher.id, lesson.id
             )
@@ -417,9 +383,8 @@ class TestAccessControlEdgeCases:
     async def test_multiple_patterns_same_teacher(self, session, teacher, student):
         """Test that teacher can access all their patterns"""
         # Create multiple patterns
-        patterns = []
-        for i in range(3):
-            pattern = RecurringPattern(
+        patterns = [
+            RecurringPattern(
                 teacher_id=teacher.id,
                 student_id=student.id,
                 start_date=date(2024, 6, 1 + i),
@@ -429,14 +394,13 @@ class TestAccessControlEdgeCases:
                 interval=1,
                 weekday=i
             )
-            session.add(pattern)
-            patterns.append(pattern)
-        
+            for i in range(3)
+        ]
+        session.add_all(patterns)
         await session.commit()
         
         # Verify teacher can access all patterns
         for pattern in patterns:
-            await session.refresh(pattern)
             can_access, error = await AccessControlService.verify_teacher_owns_pattern(
                 session, teacher.id, pattern.id
             )
@@ -459,7 +423,6 @@ class TestAccessControlEdgeCases:
         )
         session.add(pattern)
         await session.commit()
-        await session.refresh(pattern)
         
         # Create lesson linked to pattern
         lesson = Lesson(
@@ -471,7 +434,6 @@ class TestAccessControlEdgeCases:
         )
         session.add(lesson)
         await session.commit()
-        await session.refresh(lesson)
         
         # Verify teacher can access both lesson and pattern
         can_access_lesson, error_lesson = await AccessControlService.verify_teacher_owns_lesson(
@@ -0,0 +1,100 @@
+"""Micro-benchmarks for LessonService hot paths (requires pytest-benchmark)
+
+Each benchmark also pins the number of SQL statements per operation, so an
+N+1 regression fails here even when the timing noise would hide it.
+
+    python3 -m pytest test_benchmarks.py --benchmark-autosave
+    python3 -m pytest test_benchmarks.py --benchmark-compare --benchmark-compare-fail=median:30%
+"""
+import pytest
+import pytest_asyncio
+from datetime import date, time
+from sqlalchemy import delete
+from models import Teacher, Student, Lesson
+from services import lesson_service
+from services.lesson_service import LessonService
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.slow
+
+DAY = date(2030, 1, 7)
+BOOKED_HOURS = range(8, 16)
+NEW_HOURS = range(16, 22)
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def db(session, monkeypatch):
+    """Session plus a teacher/student with a full morning of lessons"""
+    monkeypatch.setattr(lesson_service, '_today_cache', [DAY, float('inf')])
+    teacher = Teacher(name="Bench Teacher", login="bench_teacher", telegram_id=1)
+    session.add(teacher)
+    await session.flush()
+    student = Student(name="Bench Student", teacher_id=teacher.id, telegram_id=2)
+    session.add(student)
+    await session.flush()
+    session.add_all([
+        Lesson(date=DAY, time=time(h, 0), teacher_id=teacher.id, student_id=student.id)
+        for h in BOOKED_HOURS
+    ])
+    await session.commit()
+    return session, teacher, student
+
+
+def test_bench_check_time_conflict(benchmark, module_loop, db, query_counter):
+    """One EXISTS probe per conflict check"""
+    session, teacher, student = db
+
+    def run():
+        return module_loop.run_until_complete(
+            LessonService.check_time_conflict(session, teacher.id, student.id, DAY, time(9, 0))
+        )
+
+    ok, _ = benchmark(run)
+    assert not ok
+    query_counter.clear()
+    run()
+    assert len(query_counter) == 1
+
+
+def test_bench_lessons_by_date(benchmark, module_loop, db, query_counter):
+    """A day's lessons plus both parties in a fixed number of queries"""
+    session, teacher, _ = db
+
+    async def load():
+        session.expunge_all()
+        lessons = await LessonService.get_lessons_by_date(session, teacher.id, DAY)
+        return [(lesson.teacher.name, lesson.student.name) for lesson in lessons]
+
+    rows = benchmark(lambda: module_loop.run_until_complete(load()))
+    assert len(rows) == len(BOOKED_HOURS)
+    query_counter.clear()
+    module_loop.run_until_complete(load())
+    assert len(query_counter) <= 3
+
+
+def test_bench_create_lessons(benchmark, module_loop, db, query_counter):
+    """Bulk booking: one occupancy SELECT regardless of batch size"""
+    session, teacher, student = db
+    items = [(teacher.id, student.id, DAY, time(h, 0)) for h in list(NEW_HOURS) + [9]]
+
+    async def clear():
+        await session.execute(delete(Lesson).where(Lesson.date == DAY, Lesson.time >= time(NEW_HOURS[0], 0)))
+        await session.commit()
+        session.expunge_all()
+
+    def setup():
+        module_loop.run_until_complete(clear())
+
+    def run():
+        return module_loop.run_until_complete(LessonService.create_lessons(session, items))
+
+    created, rejected = benchmark.pedantic(run, setup=setup, rounds=30)
+    assert len(created) == len(NEW_HOURS)
+    assert len(rejected) == 1
+
+    setup()
+    query_counter.clear()
+    run()
+    selects = [s for s in query_counter if s.lstrip().upper().startswith("SELECT")]
+    assert len(selects) == 1
@@ -12,6 +12,8 @@ from models import Base
 TEST_DB_FILE = 'test_init_db.db'
 TEST_DB_URL = f'sqlite+aiosqlite:///{TEST_DB_FILE}'
 
+pytestmark = pytest.mark.slow
+
 
 @pytest.fixture(autouse=True)
 def cleanup_test_db():
@@ -2,9 +2,9 @@
 import pytest
 import pytest_asyncio
 from datetime import date, time, timedelta
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy import select
-from models import Base, Teacher, Student, Lesson, RecurringPattern, RecurringException
+from models import Teacher, Student, Lesson, RecurringPattern, RecurringException
 from services.recurring_service import RecurringLessonService
 from services.lesson_service import LessonService
 from access_control import AccessControlService
@@ -13,25 +13,7 @@ from database import init_db
 
 TEST_DB_URL = 'sqlite+aiosqlite:///:memory:'
 
-
-@pytest_asyncio.fixture
-async def engine():
-    """Create test database engine"""
-    test_engine = create_async_engine(TEST_DB_URL, echo=False)
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    yield test_engine
-    await test_engine.dispose()
-
-
-@pytest_asyncio.fixture
-async def session(engine):
-    """Create test database session"""
-    TestSessionLocal = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
-    test_session = TestSessionLocal()
-    yield test_session
-    await test_session.rollback()
-    await test_session.close()
+pytestmark = pytest.mark.integration
 
 
 @pytest_asyncio.fixture
@@ -44,8 +26,7 @@ async def teacher(session):
         telegram_id=555666777
     )
     session.add(teacher)
-    await session.commit()
-    await session.refresh(teacher)
+    await session.flush()
     return teacher
 
 
@@ -59,8 +40,7 @@ async def student(session, teacher):
         telegram_id=333444555
     )
     session.add(student)
-    await session.commit()
-    await session.refresh(student)
+    await session.flush()
     return student
 
 
@@ -120,7 +100,6 @@ class TestEndToEndConvertAndDelete:
         )
         session.add(lesson)
         await session.commit()
-        await session.refresh(lesson)
         
         # Step 2: Convert to recurring
         pattern_config = {
@@ -289,7 +268,6 @@ class TestEndToEndAccessControl:
         )
         session.add(other_teacher)
         await session.commit()
-        await session.refresh(other_teacher)
         
         # Create a recurring lesson owned by the first teacher
         pattern = RecurringPattern(
@@ -0,0 +1,338 @@
+"""Tests for LessonService"""
+import pytest
+import pytest_asyncio
+from datetime import date, datetime, time, timedelta, timezone
+from models import Teacher, Student, Lesson
+from services import lesson_service
+from services.lesson_service import LessonService
+
+
+# LessonService's notion of today is frozen for the module so date-relative
+# cases don't depend on the wall clock (or on local vs UTC midnight)
+TODAY = date(2030, 1, 7)
+TOMORROW = TODAY + timedelta(days=1)
+YESTERDAY = TODAY - timedelta(days=1)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def frozen_today():
+    """Pin lesson_service._today() to TODAY for every test in the module"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(lesson_service, '_today_cache', [TODAY, float('inf')])
+        yield TODAY
+
+
+@pytest_asyncio.fixture
+async def teacher(session):
+    """Create test teacher"""
+    teacher = Teacher(
+        name="Lesson Teacher",
+        contact_info="lesson@example.com",
+        login="lesson_teacher",
+        telegram_id=111222333
+    )
+    session.add(teacher)
+    await session.commit()
+    return teacher
+
+
+@pytest_asyncio.fixture
+async def student(session, teacher):
+    """Create test student"""
+    student = Student(
+        name="Lesson Student",
+        contact_info="lesson_student@example.com",
+        teacher_id=teacher.id,
+        telegram_id=444555666
+    )
+    session.add(student)
+    await session.commit()
+    return student
+
+
+class TestSchedule:
+    """Tests for the upcoming schedule rows"""
+
+    @pytest.mark.asyncio
+    async def test_schedule_rows_are_upcoming_and_ordered(self, session, teacher, student):
+        """Test that past lessons are skipped and rows carry the other party's name"""
+        session.add_all([
+            Lesson(date=TODAY + timedelta(days=2), time=time(9, 0), teacher_id=teacher.id, student_id=student.id),
+            Lesson(date=TOMORROW, time=time(15, 0), teacher_id=teacher.id, student_id=student.id),
+            Lesson(date=YESTERDAY, time=time(10, 0), teacher_id=teacher.id, student_id=student.id),
+        ])
+        await session.commit()
+
+        teacher_rows = await LessonService.get_teacher_schedule(session, teacher.id)
+        assert [tuple(r) for r in teacher_rows] == [
+            (TOMORROW, time(15, 0), "Lesson Student"),
+            (TODAY + timedelta(days=2), time(9, 0), "Lesson Student"),
+        ]
+
+        student_rows = await LessonService.get_student_schedule(session, student.id)
+        assert [r[2] for r in student_rows] == ["Lesson Teacher", "Lesson Teacher"]
+
+
+class TestCheckTimeConflict:
+    """Tests for the single-query conflict probe"""
+
+    @pytest.mark.asyncio
+    async def test_teacher_and_student_conflicts(self, session, teacher, student):
+        """Test that the conflicting party is reported and the excluded lesson ignored"""
+        other_teacher = Teacher(name="Other", login="other_teacher", telegram_id=777888999)
+        other_student = Student(name="Other Student", teacher_id=teacher.id)
+        session.add_all([other_teacher, other_student])
+        await session.commit()
+
+        slot = (TOMORROW, time(10, 0))
+        lesson = Lesson(date=slot[0], time=slot[1], teacher_id=teacher.id, student_id=student.id)
+        session.add(lesson)
+        await session.commit()
+
+        ok, message = await LessonService.check_time_conflict(session, teacher.id, other_student.id, *slot)
+        assert not ok and "teacher" in message
+
+        ok, message = await LessonService.check_time_conflict(session, other_teacher.id, student.id, *slot)
+        assert not ok and "student" in message
+
+        ok, _ = await LessonService.check_time_conflict(
+            session, teacher.id, student.id, *slot, exclude_lesson_id=lesson.id
+        )
+        assert ok
+
+
+class TestLessonQueries:
+    """Tests for lesson list queries used by notification paths"""
+
+    @pytest.mark.asyncio
+    async def test_related_parties_are_eager_loaded(self, session, teacher, student):
+        """Test that teacher/student are usable without a lazy load on AsyncSession"""
+        lesson_date = TOMORROW
+        session.add(Lesson(date=lesson_date, time=time(11, 0), teacher_id=teacher.id, student_id=student.id))
+        await session.commit()
+        session.expunge_all()
+
+        by_date = await LessonService.get_lessons_by_date(session, teacher.id, lesson_date)
+        future = await LessonService.get_future_lessons(session, student.id)
+
+        for lesson in by_date + future:
+            assert lesson.teacher.name == "Lesson Teacher"
+            assert lesson.student.telegram_id == 444555666
+
+    @pytest.mark.asyncio
+    async def test_query_count_does_not_grow_with_lessons(self, session, teacher, student, query_counter):
+        """Test that loading a day's lessons and their parties is a fixed number of queries"""
+        lesson_date = TOMORROW
+        other = Student(name="Second Student", teacher_id=teacher.id)
+        session.add(other)
+        await session.flush()
+        session.add_all([
+            Lesson(date=lesson_date, time=time(h, 0), teacher_id=teacher.id,
+                   student_id=student.id if h % 2 else other.id)
+            for h in range(8, 16)
+        ])
+        await session.commit()
+        session.expunge_all()
+
+        query_counter.clear()
+        lessons = await LessonService.get_lessons_by_date(session, teacher.id, lesson_date)
+        names = {lesson.student.name for lesson in lessons}
+
+        assert len(lessons) == 8
+        assert names == {"Lesson Student", "Second Student"}
+        # lessons + selectin(teachers) + selectin(students)
+        assert len(query_counter) == 3
+
+    @pytest.mark.asyncio
+    async def test_future_lessons_parties_need_no_extra_queries(self, session, teacher, student, query_counter):
+        """Test that reading teacher names off future lessons adds no per-row query"""
+        session.add_all([
+            Lesson(date=TODAY + timedelta(days=d), time=time(10, 0),
+                   teacher_id=teacher.id, student_id=student.id)
+            for d in range(1, 6)
+        ])
+        await session.commit()
+        session.expunge_all()
+
+        query_counter.clear()
+        lessons = await LessonService.get_future_lessons(session, student.id)
+        assert {lesson.teacher.name for lesson in lessons} == {"Lesson Teacher"}
+        assert len(lessons) == 5
+        assert len(query_counter) <= 3
+
+    @pytest.mark.asyncio
+    async def test_lesson_with_parties_is_one_query(self, session, teacher, student, query_counter):
+        """Test that a lesson and both notification recipients load together"""
+        lesson = Lesson(date=TOMORROW, time=time(12, 0),
+                        teacher_id=teacher.id, student_id=student.id)
+        session.add(lesson)
+        await session.commit()
+        session.expunge_all()
+
+        query_counter.clear()
+        loaded = await LessonService.get_lesson_with_parties(session, lesson.id)
+
+        assert (loaded.teacher.name, loaded.teacher.telegram_id) == ("Lesson Teacher", 111222333)
+        assert (loaded.student.name, loaded.student.telegram_id) == ("Lesson Student", 444555666)
+        assert len(query_counter) == 1
+        assert await LessonService.get_lesson_with_parties(session, -1) is None
+
+
+class TestCreateLessons:
+    """Tests for bulk lesson creation"""
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_skips_conflicts(self, session, teacher, student, query_counter):
+        """Test that existing, in-batch and past conflicts are rejected with one lookup"""
+        other = Student(name="Second Student", teacher_id=teacher.id)
+        session.add(other)
+        await session.commit()
+
+        day = TODAY + timedelta(days=3)
+        session.add(Lesson(date=day, time=time(9, 0), teacher_id=teacher.id, student_id=student.id))
+        await session.commit()
+
+        query_counter.clear()
+        created, rejected = await LessonService.create_lessons(session, [
+            (teacher.id, other.id, day, time(9, 0)),      # teacher busy (existing)
+            (teacher.id, student.id, day, time(10, 0)),
+            (teacher.id, other.id, day, time(10, 0)),     # teacher busy (same batch)
+            (teacher.id, other.id, day, time(11, 0)),
+            (teacher.id, other.id, YESTERDAY, time(11, 0)),
+        ])
+
+        assert [(l.student_id, l.time) for l in created] == [(student.id, time(10, 0)), (other.id, time(11, 0))]
+        assert all(l.id is not None for l in created)
+        assert [reason for _, reason in rejected] == [
+            "The teacher already has a lesson scheduled at this time",
+            "The teacher already has a lesson scheduled at this time",
+            "Cannot schedule a lesson for a past date",
+        ]
+        selects = [s for s in query_counter if s.lstrip().upper().startswith("SELECT")]
+        assert len(selects) == 1
+
+
+class TestToday:
+    """Tests for the cached current date"""
+
+    def test_today_is_cached_but_not_across_midnight(self, monkeypatch):
+        """Test that the date is reused within the TTL and refreshed at midnight"""
+        clock = [datetime(2025, 3, 1, 23, 59, 30, tzinfo=timezone.utc)]
+        mono = [1000.0]
+
+        class FakeDatetime(datetime):
+            calls = 0
+
+            @classmethod
+            def now(cls, tz=None):
+                cls.calls += 1
+                return clock[0]
+
+        monkeypatch.setattr(lesson_service, 'datetime', FakeDatetime)
+        monkeypatch.setattr(lesson_service, 'monotonic', lambda: mono[0])
+        monkeypatch.setattr(lesson_service, '_today_cache', [None, 0.0])
+
+        assert lesson_service._today() == date(2025, 3, 1)
+        mono[0] += 10
+        assert lesson_service._today() == date(2025, 3, 1)
+        assert FakeDatetime.calls == 1
+
+        clock[0] += timedelta(seconds=31)
+        mono[0] += 21
+        assert lesson_service._today() == date(2025, 3, 2)
+
+
+class TestCancelLesson:
+    """Tests for lesson cancellation"""
+
+    @pytest.mark.asyncio
+    async def test_cancel_returns_deleted_values(self, session, teacher, student, query_counter):
+        """Test that cancel deletes in one statement and reports what was removed"""
+        lesson = Lesson(date=TOMORROW, time=time(12, 0),
+                        teacher_id=teacher.id, student_id=student.id)
+        session.add(lesson)
+        await session.commit()
+
+        query_counter.clear()
+        ok, _, cancelled = await LessonService.cancel_lesson(session, lesson.id)
+        assert ok
+        assert (cancelled.id, cancelled.teacher_id, cancelled.student_id, cancelled.time) == \
+            (lesson.id, teacher.id, student.id, time(12, 0))
+        assert len(query_counter) == 1
+        assert await session.get(Lesson, lesson.id) is None
+
+        ok, message, cancelled = await LessonService.cancel_lesson(session, lesson.id)
+        assert not ok and cancelled is None and message == "Lesson not found"
+
+
+class TestRescheduleLesson:
+    """Tests for the conditional-UPDATE reschedule"""
+
+    @pytest.mark.asyncio
+    async def test_reschedule_fast_path_and_failures(self, session, teacher, student, query_counter):
+        """Test that a free slot takes one UPDATE and each failure gets its message"""
+        day = TOMORROW
+        lesson = Lesson(date=day, time=time(9, 0), teacher_id=teacher.id, student_id=student.id)
+        busy = Lesson(date=day, time=time(11, 0), teacher_id=teacher.id, student_id=student.id)
+        past = Lesson(date=YESTERDAY, time=time(9, 0),
+                      teacher_id=teacher.id, student_id=student.id)
+        session.add_all([lesson, busy, past])
+        await session.commit()
+
+        query_counter.clear()
+        ok, _ = await LessonService.reschedule_lesson(session, lesson.id, time(10, 0))
+        assert ok
+        updates = [s for s in query_counter if s.lstrip().upper().startswith("UPDATE")]
+        assert len(updates) == 1
+        await session.refresh(lesson)
+        assert lesson.time == time(10, 0)
+
+        ok, message = await LessonService.reschedule_lesson(session, lesson.id, time(11, 0))
+        assert not ok and message == "The teacher already has a lesson scheduled at this time"
+
+        ok, message = await LessonService.reschedule_lesson(session, past.id, time(12, 0))
+        assert not ok and message == "Cannot reschedule a lesson in the past"
+
+        ok, message = await LessonService.reschedule_lesson(session, 999999, time(12, 0))
+        assert not ok and message == "Lesson not found"
+
+
+class TestCreateLesson:
+    """Tests for single lesson creation"""
+
+    @pytest.mark.asyncio
+    async def test_create_does_not_reload_after_insert(self, session, teacher, student, query_counter):
+        """Test that the created lesson is usable without a SELECT after the INSERT"""
+        query_counter.clear()
+        ok, _, lesson = await LessonService.create_lesson(
+            session, teacher.id, student.id, TOMORROW, time(13, 0)
+        )
+        assert ok
+        assert lesson.id is not None and lesson.is_paid is False
+
+        insert_at = next(i for i, s in enumerate(query_counter) if s.lstrip().upper().startswith("INSERT"))
+        assert not any(s.lstrip().upper().startswith("SELECT") for s in query_counter[insert_at + 1:])
+
+    @pytest.mark.asyncio
+    async def test_slot_constraints_reject_double_booking(self, session, teacher, student):
+        """Test that constraint violations come back as the conflict messages"""
+        other_teacher = Teacher(name="Other", login="other_teacher", telegram_id=777888999)
+        other_student = Student(name="Other Student", teacher_id=teacher.id)
+        session.add_all([other_teacher, other_student])
+        await session.commit()
+        slot = (TOMORROW, time(14, 0))
+
+        ok, _, first = await LessonService.create_lesson(session, teacher.id, student.id, *slot)
+        assert ok
+
+        ok, message, lesson = await LessonService.create_lesson(session, teacher.id, other_student.id, *slot)
+        assert not ok and lesson is None
+        assert message == "The teacher already has a lesson scheduled at this time"
+
+        ok, message, _ = await LessonService.create_lesson(session, other_teacher.id, student.id, *slot)
+        assert not ok and message == "The student already has a lesson scheduled at this time"
+
+        # The failed savepoints leave the session and the first lesson intact
+        assert (await session.get(Lesson, first.id)) is first
+        ok, _, _ = await LessonService.create_lesson(session, other_teacher.id, other_student.id, *slot)
+        assert ok
@@ -0,0 +1,97 @@
+"""Tests for bot middlewares"""
+import pytest
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from bot import middlewares
+from bot.middlewares import TokenBucket, DBSessionMiddleware, OutgoingRateLimitMiddleware
+from services.notification_queue import fanout_send
+
+
+class TestTokenBucket:
+    """Tests for the outgoing send token bucket"""
+
+    def test_burst_then_wait(self, monkeypatch):
+        """Test that reservations are free up to capacity and then paced at rate"""
+        now = [0.0]
+        monkeypatch.setattr(middlewares.time, 'monotonic', lambda: now[0])
+        bucket = TokenBucket(rate=2, capacity=2)
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.5)
+        now[0] += 1.5
+        assert bucket.reserve() == 0.0
+
+
+class TestDBSessionMiddleware:
+    """Tests for session injection"""
+
+    @pytest.mark.asyncio
+    async def test_handler_gets_session_from_factory(self):
+        """Test that the handler sees the factory's session and it is closed afterwards"""
+        session = SimpleNamespace(closed=False)
+
+        @asynccontextmanager
+        async def factory():
+            yield session
+            session.closed = True
+
+        async def handler(event, data):
+            assert not session.closed
+            return data['session']
+
+        middleware = DBSessionMiddleware(session_factory=factory)
+        assert await middleware(handler, None, {}) is session
+        assert session.closed
+
+
+class TestOutgoingRateLimitMiddleware:
+    """Tests for outgoing API call pacing"""
+
+    @pytest.mark.asyncio
+    async def test_same_chat_is_paced_other_calls_are_not(self, monkeypatch):
+        """Test that only fan-out calls addressed to a busy chat are delayed"""
+        now = [0.0]
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        async def make_request(bot, method):
+            return method
+
+        monkeypatch.setattr(middlewares.time, 'monotonic', lambda: now[0])
+        monkeypatch.setattr(middlewares.asyncio, 'sleep', fake_sleep)
+        middleware = OutgoingRateLimitMiddleware()
+        token = fanout_send.set(True)
+        try:
+            for _ in range(middlewares.OUTGOING_CHAT_BURST):
+                await middleware(make_request, None, SimpleNamespace(chat_id=1))
+            assert sleeps == []
+
+            await middleware(make_request, None, SimpleNamespace(chat_id=2))
+            await middleware(make_request, None, SimpleNamespace(callback_query_id="x"))
+            assert sleeps == []
+
+            await middleware(make_request, None, SimpleNamespace(chat_id=1))
+        finally:
+            fanout_send.reset(token)
+        assert sleeps == [pytest.approx(1 / middlewares.OUTGOING_CHAT_PER_SECOND)]
+
+    @pytest.mark.asyncio
+    async def test_interactive_replies_are_not_paced(self, monkeypatch):
+        """Test that calls outside fan-out tasks never sleep, even to a busy chat"""
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        async def make_request(bot, method):
+            return method
+
+        monkeypatch.setattr(middlewares.time, 'monotonic', lambda: 0.0)
+        monkeypatch.setattr(middlewares.asyncio, 'sleep', fake_sleep)
+        middleware = OutgoingRateLimitMiddleware()
+
+        for _ in range(middlewares.OUTGOING_CHAT_BURST * 3):
+            await middleware(make_request, None, SimpleNamespace(chat_id=1))
+        assert sleeps == []
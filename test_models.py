@@ -1,33 +1,15 @@
 """Unit tests for RecurringPattern and RecurringException models"""
 import pytest
 from datetime import date, time
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import inspect
 from sqlalchemy.exc import IntegrityError
-from models import Base, Teacher, Student, RecurringPattern, RecurringException, Lesson
-
-
-# Test database setup
-TEST_DB_URL = 'sqlite:///:memory:'
-
-
-@pytest.fixture
-def engine():
-    """Create test database engine"""
-    test_engine = create_engine(TEST_DB_URL, echo=False)
-    Base.metadata.create_all(test_engine)
-    yield test_engine
-    test_engine.dispose()
+from models import Teacher, Student, RecurringPattern, RecurringException, Lesson
 
 
 @pytest.fixture
-def session(engine):
-    """Create test database session"""
-    TestSessionLocal = sessionmaker(bind=engine)
-    test_session = TestSessionLocal()
-    yield test_session
-    test_session.rollback()
-    test_session.close()
+def session(sync_session):
+    """Model tests run on the synchronous shared session"""
+    return sync_session
 
 
 @pytest.fixture
@@ -41,7 +23,6 @@ def teacher(session):
     )
     session.add(teacher)
     session.commit()
-    session.refresh(teacher)
     return teacher
 
 
@@ -56,7 +37,6 @@ def student(session, teacher):
     )
     session.add(student)
     session.commit()
-    session.refresh(student)
     return student
 
 
@@ -77,7 +57,6 @@ class TestRecurringPatternCreation:
         )
         session.add(pattern)
         session.commit()
-        session.refresh(pattern)
         
         assert pattern.id is not None
         assert pattern.teacher_id == teacher.id
@@ -100,7 +79,6 @@ class TestRecurringPatternCreation:
         )
         session.add(pattern)
         session.commit()
-        session.refresh(pattern)
         
         assert pattern.id is not None
         assert pattern.frequency == 'biweekly'
@@ -120,7 +98,6 @@ class TestRecurringPatternCreation:
         )
         session.add(pattern)
         session.commit()
-        session.refresh(pattern)
         
         assert pattern.id is not None
         assert pattern.frequency == 'monthly'
@@ -140,7 +117,6 @@ class TestRecurringPatternCreation:
         )
         session.add(pattern)
         session.commit()
-        session.refresh(pattern)
         
         assert pattern.id is not None
         assert pattern.end_date is None
@@ -156,7 +132,6 @@ class TestRecurringPatternCreation:
         )
         session.add(lesson)
         session.commit()
-        session.refresh(lesson)
         
         # Create pattern from lesson
         pattern = RecurringPattern(
@@ -171,7 +146,6 @@ class TestRecurringPatternCreation:
         )
         session.add(pattern)
         session.commit()
-        session.refresh(pattern)
         
         assert pattern.id is not None
         assert pattern.created_from_lesson_id == lesson.id
@@ -228,41 +202,16 @@ class TestRecurringPatternFrequencyValidation:
         
         assert pattern.frequency == 'monthly'
     
-    def test_invalid_frequency_raises_error(self, session, teacher, student):
-        """Test that invalid frequency raises ValueError"""
+    @pytest.mark.parametrize("frequency", ['daily', 'yearly', ''], ids=['daily', 'yearly', 'empty'])
+    def test_invalid_frequency_raises_error(self, frequency):
+        """Test that frequencies outside weekly/biweekly/monthly raise ValueError"""
         with pytest.raises(ValueError, match="Frequency must be one of"):
-            pattern = RecurringPattern(
-                teacher_id=teacher.id,
-                student_id=student.id,
+            RecurringPattern(
+                teacher_id=1,
+                student_id=1,
                 start_date=date(2024, 1, 8),
                 time=time(15, 0),
-                frequency='daily',  # Invalid frequency
-                interval=1,
-                weekday=0
-            )
-    
-    def test_invalid_frequency_yearly(self, session, teacher, student):
-        """Test that 'yearly' frequency is rejected"""
-        with pytest.raises(ValueError, match="Frequency must be one of"):
-            pattern = RecurringPattern(
-                teacher_id=teacher.id,
-                student_id=student.id,
-                start_date=date(2024, 1, 8),
-                time=time(15, 0),
-                frequency='yearly',
-                interval=1,
-                weekday=0
-            )
-    
-    def test_empty_frequency_raises_error(self, session, teacher, student):
-        """Test that empty frequency raises ValueError"""
-        with pytest.raises(ValueError, match="Frequency must be one of"):
-            pattern = RecurringPattern(
-                teacher_id=teacher.id,
-                student_id=student.id,
-                start_date=date(2024, 1, 8),
-                time=time(15, 0),
-                frequency='',
+                frequency=frequency,
                 interval=1,
                 weekday=0
             )
@@ -285,7 +234,6 @@ class TestRecurringExceptionCascadeDelete:
         )
         session.add(pattern)
         session.commit()
-        session.refresh(pattern)
         
         # Create exceptions
         exception1 = RecurringException(
@@ -326,7 +274,6 @@ class TestRecurringExceptionCascadeDelete:
         )
         session.add(pattern)
         session.commit()
-        session.refresh(pattern)
         
         pattern_id = pattern.id
         
@@ -351,7 +298,6 @@ class TestRecurringExceptionCascadeDelete:
         )
         session.add(pattern)
         session.commit()
-        session.refresh(pattern)
         
         # Create 5 exceptions with valid dates
         exceptions = [
@@ -410,7 +356,6 @@ class TestRecurringExceptionUniqueConstraint:
         )
         session.add(pattern)
         session.commit()
-        session.refresh(pattern)
         
         # Create first exception
         exception1 = RecurringException(
@@ -455,8 +400,6 @@ class TestRecurringExceptionUniqueConstraint:
         )
         session.add_all([pattern1, pattern2])
         session.commit()
-        session.refresh(pattern1)
-        session.refresh(pattern2)
         
         # Create exceptions with same date for different patterns
         exception1 = RecurringException(
@@ -473,8 +416,6 @@ class TestRecurringExceptionUniqueConstraint:
         session.commit()
         
         # Both should be created successfully
-        session.refresh(exception1)
-        session.refresh(exception2)
         assert exception1.id is not None
         assert exception2.id is not None
     
@@ -491,7 +432,6 @@ class TestRecurringExceptionUniqueConstraint:
         )
         session.add(pattern)
         session.commit()
-        session.refresh(pattern)
         
         # Create multiple exceptions with different dates
         exception1 = RecurringException(
@@ -515,3 +455,42 @@ class TestRecurringExceptionUniqueConstraint:
         # All should be created successfully
         exceptions = session.query(RecurringException).filter_by(pattern_id=pattern.id).all()
         assert len(exceptions) == 3
+
+
+class TestLessonSlotUniqueConstraint:
+    """Tests for unique constraints on lesson time slots"""
+
+    def test_student_cannot_have_two_lessons_in_same_slot(self, session, teacher, student):
+        """Test that duplicate (student_id, date, time) raises IntegrityError"""
+        other_teacher = Teacher(
+            name="Other Teacher",
+            contact_info="other@example.com",
+            login="teacher2",
+            telegram_id=111222333
+        )
+        session.add(other_teacher)
+        session.commit()
+
+        session.add(Lesson(
+            teacher_id=teacher.id,
+            student_id=student.id,
+            date=date(2024, 1, 15),
+            time=time(15, 0)
+        ))
+        session.commit()
+
+        session.add(Lesson(
+            teacher_id=other_teacher.id,
+            student_id=student.id,
+            date=date(2024, 1, 15),
+            time=time(15, 0)
+        ))
+        with pytest.raises(IntegrityError):
+            session.commit()
+
+    def test_conflict_lookups_are_indexed(self, sync_engine):
+        """Test that (teacher|student, date, time) lookups have a composite index"""
+        constraints = inspect(sync_engine).get_unique_constraints('lessons')
+        columns = {c['name']: c['column_names'] for c in constraints}
+        assert columns['uq_lesson_teacher_date_time'] == ['teacher_id', 'date', 'time']
+        assert columns['uq_lesson_student_date_time'] == ['student_id', 'date', 'time']
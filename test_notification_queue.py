@@ -0,0 +1,70 @@
+"""Tests for the background notification queue"""
+import asyncio
+import pytest
+from services.notification_queue import NotificationQueue, fanout_send
+
+
+class TestNotificationQueue:
+    """Tests for NotificationQueue"""
+
+    @pytest.mark.asyncio
+    async def test_queued_notifications_are_sent_by_workers(self):
+        """Test that enqueued calls run in the background and drain on stop"""
+        sent = []
+
+        async def notify(chat_id, text=None):
+            sent.append((chat_id, text))
+
+        queue = NotificationQueue(maxsize=10, workers=2)
+        queue.start()
+        assert queue.enqueue(notify, 1, text="a")
+        assert queue.enqueue(notify, 2, text="b")
+        await queue.stop()
+
+        assert sorted(sent) == [(1, "a"), (2, "b")]
+        assert not queue.running
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_instead_of_blocking(self):
+        """Test that enqueue returns False once maxsize is reached"""
+        async def notify():
+            pass
+
+        queue = NotificationQueue(maxsize=1, workers=1)
+        assert queue.enqueue(notify)
+        assert not queue.enqueue(notify)
+
+    @pytest.mark.asyncio
+    async def test_failing_notification_does_not_stop_worker(self):
+        """Test that a worker keeps draining after a send error"""
+        sent = []
+
+        async def broken():
+            raise RuntimeError("telegram down")
+
+        async def notify():
+            sent.append(True)
+
+        queue = NotificationQueue(maxsize=10, workers=1)
+        queue.start()
+        queue.enqueue(broken)
+        queue.enqueue(notify)
+        await asyncio.wait_for(queue.stop(), timeout=5)
+
+        assert sent == [True]
+
+    @pytest.mark.asyncio
+    async def test_workers_send_as_fanout(self):
+        """Test that queued sends are marked for outgoing pacing, the caller is not"""
+        seen = []
+
+        async def notify():
+            seen.append(fanout_send.get())
+
+        queue = NotificationQueue(maxsize=10, workers=1)
+        queue.start()
+        queue.enqueue(notify)
+        await queue.stop()
+
+        assert seen == [True]
+        assert fanout_send.get() is False
@@ -0,0 +1,54 @@
+"""Tests for NotificationService message rendering"""
+import pytest
+from datetime import date, time
+from types import SimpleNamespace
+from services.notification_service import NotificationService, _fmt_hm
+
+
+class FakeBot:
+    """Collects send_message calls instead of hitting Telegram"""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_message(self, chat_id, text, **kwargs):
+        self.sent.append((chat_id, text))
+
+
+@pytest.fixture
+def parties():
+    teacher = SimpleNamespace(id=1, name="Anna", telegram_id=100)
+    student = SimpleNamespace(id=2, name="Bob", telegram_id=200)
+    return teacher, student
+
+
+class TestNotificationText:
+    """Tests for the precompiled notification templates"""
+
+    def test_fmt_hm_matches_strftime(self):
+        """Test that _fmt_hm is a drop-in for strftime('%H:%M')"""
+        for t in (time(0, 0), time(9, 5), time(23, 59)):
+            assert _fmt_hm(t) == t.strftime('%H:%M')
+
+    @pytest.mark.asyncio
+    async def test_student_messages(self, parties):
+        """Test the rendered text of the student-facing notifications"""
+        teacher, student = parties
+        bot = FakeBot()
+        d, t = date(2025, 3, 4), time(9, 0)
+
+        await NotificationService.notify_student_lesson_created(bot, student, teacher, d, t)
+        await NotificationService.notify_student_lesson_cancelled(bot, student, teacher, d, t)
+        await NotificationService.notify_student_lesson_cancelled(bot, student, teacher, d, t, is_single_instance=True)
+        await NotificationService.notify_student_reschedule_result(bot, student, teacher, d, t, accepted=True)
+        await NotificationService.notify_student_reschedule_result(bot, student, teacher, d, t, accepted=False)
+
+        assert [text for _, text in bot.sent] == [
+            "You have a lesson scheduled with Anna on 2025-03-04 at 09:00.",
+            "The lesson with Anna on 2025-03-04 at 09:00 has been cancelled.",
+            "The lesson with Anna on 2025-03-04 at 09:00 has been cancelled. "
+            "This is a single cancellation - other lessons in the series remain scheduled.",
+            "Your lesson with Anna has been rescheduled to 2025-03-04 at 09:00.",
+            "Your request to reschedule the lesson with Anna was declined.",
+        ]
+        assert {chat_id for chat_id, _ in bot.sent} == {200}
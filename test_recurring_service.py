@@ -3,6 +3,7 @@ import pytest
 import pytest_asyncio
 from datetime import date, time, timedelta
 from hypothesis import given, strategies as st, settings, assume
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from models import Base, Teacher, Student, Lesson, RecurringPattern, RecurringException
 from services.recurring_service import RecurringLessonService
@@ -13,25 +14,17 @@ from access_control import AccessControlService
 # Test database setup
 TEST_DB_URL = 'sqlite+aiosqlite:///:memory:'
 
-
-@pytest_asyncio.fixture
-async def engine():
-    """Create test database engine"""
-    test_engine = create_async_engine(TEST_DB_URL, echo=False)
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    yield test_engine
-    await test_engine.dispose()
-
-
-@pytest_asyncio.fixture
-async def session(engine):
-    """Create test database session"""
-    TestSessionLocal = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
-    test_session = TestSessionLocal()
-    yield test_session
-    await test_session.rollback()
-    await test_session.close()
+# Verification queries shared by the tests, built once with bound parameters
+LESSON_BY_ID = select(Lesson).where(Lesson.id == bindparam('lesson_id'))
+LESSONS_BY_PATTERN = select(Lesson).where(Lesson.recurring_pattern_id == bindparam('pattern_id'))
+PATTERN_BY_ID = select(RecurringPattern).where(RecurringPattern.id == bindparam('pattern_id'))
+ALL_EXCEPTIONS = select(RecurringException)
+EXCEPTIONS_BY_PATTERN = select(RecurringException).where(
+    RecurringException.pattern_id == bindparam('pattern_id')
+)
+EXCEPTION_FOR_DATE = EXCEPTIONS_BY_PATTERN.where(
+    RecurringException.exception_date == bindparam('exception_date')
+)
 
 
 @pytest_asyncio.fixture
@@ -45,7 +38,6 @@ async def teacher(session):
     )
     session.add(teacher)
     await session.commit()
-    await session.refresh(teacher)
     return teacher
 
 
@@ -60,7 +52,6 @@ async def another_teacher(session):
     )
     session.add(teacher)
     await session.commit()
-    await session.refresh(teacher)
     return teacher
 
 
@@ -75,7 +66,6 @@ async def student(session, teacher):
     )
     session.add(student)
     await session.commit()
-    await session.refresh(student)
     return student
 
 
@@ -90,7 +80,6 @@ async def another_student(session, teacher):
     )
     session.add(student)
     await session.commit()
-    await session.refresh(student)
     return student
 
 
@@ -123,7 +112,7 @@ class TestCreateRecurringLesson:
         
         # Verify first lesson was created
         result = await session.execute(
-            __import__('sqlalchemy').select(Lesson).filter_by(recurring_pattern_id=result_pattern.id)
+            LESSONS_BY_PATTERN, {'pattern_id': result_pattern.id}
         )
         first_lesson = result.scalar_one_or_none()
         assert first_lesson is not None
@@ -255,7 +244,6 @@ class TestConvertToRecurring:
         )
         session.add(lesson)
         await session.commit()
-        await session.refresh(lesson)
         
         # Convert to recurring
         pattern_config = {
@@ -308,7 +296,6 @@ class TestConvertToRecurring:
         )
         session.add(lesson)
         await session.commit()
-        await session.refresh(lesson)
         
         # Try to convert already recurring lesson
         pattern_config = {
@@ -353,7 +340,6 @@ class TestConvertToRecurring:
         )
         session.add(lesson)
         await session.commit()
-        await session.refresh(lesson)
         
         pattern_config = {
             'frequency': 'monthly',
@@ -399,7 +385,6 @@ class TestDeleteSingleInstance:
         )
         session.add(lesson)
         await session.commit()
-        await session.refresh(lesson)
         
         # Delete single instance
         success, message = await RecurringLessonService.delete_single_instance(
@@ -411,10 +396,7 @@ class TestDeleteSingleInstance:
         
         # Verify exception was created
         result = await session.execute(
-            __import__('sqlalchemy').select(RecurringException).filter_by(
-                pattern_id=pattern.id,
-                exception_date=lesson.date
-            )
+            EXCEPTION_FOR_DATE, {'pattern_id': pattern.id, 'exception_date': lesson.date}
         )
         exception = result.scalar_one_or_none()
         assert exception is not None
@@ -422,7 +404,7 @@ class TestDeleteSingleInstance:
         
         # Verify lesson was deleted
         result = await session.execute(
-            __import__('sqlalchemy').select(Lesson).filter_by(id=lesson.id)
+            LESSON_BY_ID, {'lesson_id': lesson.id}
         )
         assert result.scalar_one_or_none() is None
     
@@ -437,7 +419,6 @@ class TestDeleteSingleInstance:
         )
         session.add(lesson)
         await session.commit()
-        await session.refresh(lesson)
         lesson_id = lesson.id
         
         # Delete single instance
@@ -449,13 +430,13 @@ class TestDeleteSingleInstance:
         
         # Verify no exception was created (lesson is not recurring)
         result = await session.execute(
-            __import__('sqlalchemy').select(RecurringException)
+            ALL_EXCEPTIONS
         )
         assert result.scalar_one_or_none() is None
         
         # Verify lesson was deleted
         result = await session.execute(
-            __import__('sqlalchemy').select(Lesson).filter_by(id=lesson_id)
+            LESSON_BY_ID, {'lesson_id': lesson_id}
         )
         assert result.scalar_one_or_none() is None
     
@@ -494,7 +475,6 @@ class TestDeleteSingleInstance:
         )
         session.add(lesson)
         await session.commit()
-        await session.refresh(lesson)
         
         # First delete
         success1, _ = await RecurringLessonService.delete_single_instance(
@@ -558,13 +538,13 @@ class TestDeleteRecurringSeries:
         
         # Verify pattern is deleted
         result = await session.execute(
-            __import__('sqlalchemy').select(RecurringPattern).filter_by(id=pattern.id)
+            PATTERN_BY_ID, {'pattern_id': pattern.id}
         )
         assert result.scalar_one_or_none() is None
         
         # Verify lessons are deleted
         result = await session.execute(
-            __import__('sqlalchemy').select(Lesson).filter_by(recurring_pattern_id=pattern.id)
+            LESSONS_BY_PATTERN, {'pattern_id': pattern.id}
         )
         assert result.scalars().all() == []
     
@@ -606,7 +586,7 @@ class TestDeleteRecurringSeries:
         # Past lesson should be deleted too (since we delete all lessons with pattern_id >= today)
         # Actually, the past lesson has date < today, so it should be preserved
         result = await session.execute(
-            __import__('sqlalchemy').select(Lesson).filter_by(id=past_lesson_id)
+            LESSON_BY_ID, {'lesson_id': past_lesson_id}
         )
         # Past lesson should be preserved (date < today)
         preserved = result.scalar_one_or_none()
@@ -656,7 +636,7 @@ class TestDeleteRecurringSeries:
         
         # Verify exceptions are cascade deleted
         result = await session.execute(
-            __import__('sqlalchemy').select(RecurringException).filter_by(pattern_id=pattern.id)
+            EXCEPTIONS_BY_PATTERN, {'pattern_id': pattern.id}
         )
         assert result.scalars().all() == []
 
@@ -857,6 +837,7 @@ class TestGetRecurringLessons:
         assert len(db_lessons) == 1
 
 
+@pytest.mark.slow
 class TestRecurringLessonPropertyTests:
     """Property-based tests for RecurringLessonService
     
@@ -920,8 +901,7 @@ class TestRecurringLessonPropertyTests:
                 telegram_id=777777
             )
             session.add(teacher)
-            await session.commit()
-            await session.refresh(teacher)
+            await session.flush()
             
             student = Student(
                 name="Prop Student",
@@ -930,8 +910,7 @@ class TestRecurringLessonPropertyTests:
                 telegram_id=888888
             )
             session.add(student)
-            await session.commit()
-            await session.refresh(student)
+            await session.flush()
             
             pattern = RecurringPattern(
                 teacher_id=teacher.id,
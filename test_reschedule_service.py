@@ -11,6 +11,9 @@ from services.reschedule_service import RescheduleService
 from services.lesson_service import LessonService
 
 
+pytestmark = pytest.mark.integration
+
+
 @pytest_asyncio.fixture
 async def db_session():
     """Create a test database session"""
@@ -0,0 +1,181 @@
+"""Tests for the telegram_id -> user id cache"""
+import asyncio
+import pytest
+from models import Teacher, Student
+from services import user_cache
+from services.user_cache import (
+    TTLCache, get_teacher_id, get_student_id, invalidate_user, get_roster, invalidate_roster,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_user_cache():
+    """Start and end every test with an empty in-process cache"""
+    user_cache.clear_user_cache()
+    yield
+    user_cache.clear_user_cache()
+
+
+class TestTTLCache:
+    """Tests for the TTLCache container"""
+
+    def test_entries_expire(self, monkeypatch):
+        """Test that entries are dropped once their TTL has passed"""
+        now = [100.0]
+        monkeypatch.setattr(user_cache.time, 'monotonic', lambda: now[0])
+        cache = TTLCache(maxsize=10, ttl=5)
+        cache.set('a', 1)
+        assert cache.get('a') == 1
+        now[0] += 6
+        assert cache.get('a') is None
+
+    def test_least_recently_used_is_evicted(self):
+        """Test that the cache never grows past maxsize"""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert len(cache) == 2
+
+
+class TestUserIdLookup:
+    """Tests for cached teacher/student id lookups"""
+
+    @pytest.mark.asyncio
+    async def test_teacher_id_is_cached_after_first_lookup(self, session):
+        """Test that a hit is served from cache until invalidated"""
+        teacher = Teacher(name="T", login="t1", telegram_id=111)
+        session.add(teacher)
+        await session.commit()
+
+        assert await get_teacher_id(session, 111) == teacher.id
+        assert user_cache.cached_teacher_id(111) == teacher.id
+
+        await invalidate_user(111)
+        assert user_cache.cached_teacher_id(111) is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_user_is_not_cached(self, session):
+        """Test that misses are not cached so later registration is seen"""
+        assert await get_student_id(session, 222) is None
+
+        teacher = Teacher(name="T", login="t1", telegram_id=111)
+        student = Student(name="S", telegram_id=222, teacher=teacher)
+        session.add_all([teacher, student])
+        await session.commit()
+
+        assert await get_student_id(session, 222) == student.id
+
+
+class TestRosterCache:
+    """Tests for the cached per-teacher student roster"""
+
+    @pytest.mark.asyncio
+    async def test_roster_is_served_from_cache_until_invalidated(self, session):
+        """Test that new students only show up after the roster is invalidated"""
+        teacher = Teacher(name="T", login="t1", telegram_id=111)
+        session.add_all([teacher, Student(name="A", contact_info="a@x", teacher=teacher)])
+        await session.commit()
+
+        roster = await get_roster(session, teacher.id)
+        assert [(s.name, s.contact_info) for s in roster] == [("A", "a@x")]
+
+        session.add(Student(name="B", teacher_id=teacher.id))
+        await session.commit()
+        assert await get_roster(session, teacher.id) is roster
+
+        await invalidate_roster(teacher.id)
+        assert [s.name for s in await get_roster(session, teacher.id)] == ["A", "B"]
+
+
+class FakeRedis:
+    """Minimal async stand-in for redis.asyncio.Redis"""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = str(value)
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+class Process:
+    """Independent in-process cache tier, as another bot process would have"""
+
+    NAMES = ('_teacher_ids', '_student_ids', '_rosters')
+
+    def __init__(self):
+        self.caches = {
+            name: TTLCache(user_cache.USER_CACHE_MAXSIZE, user_cache.USER_CACHE_TTL_SECONDS)
+            for name in self.NAMES
+        }
+
+    def activate(self, monkeypatch):
+        for name, cache in self.caches.items():
+            monkeypatch.setattr(user_cache, name, cache)
+
+
+class TestSharedTier:
+    """Tests for the optional Redis tier behind the in-process cache"""
+
+    @pytest.mark.asyncio
+    async def test_lookup_is_shared_and_invalidated(self, session, monkeypatch):
+        """Test that a DB hit is published, reused from Redis, and deleted on invalidation"""
+        shared = FakeRedis()
+        monkeypatch.setattr(user_cache, '_redis', shared)
+        teacher = Teacher(name="T", login="t1", telegram_id=111)
+        session.add(teacher)
+        await session.commit()
+
+        assert await get_teacher_id(session, 111) == teacher.id
+        await asyncio.gather(*user_cache._pending)
+        assert shared.data["tg:teacher:111"] == str(teacher.id)
+
+        shared.data["tg:teacher:999"] = "42"
+        assert await get_teacher_id(session, 999) == 42
+
+        await invalidate_user(111)
+        assert "tg:teacher:111" not in shared.data
+
+    @pytest.mark.asyncio
+    async def test_other_process_sees_changes_within_short_ttl(self, session, monkeypatch):
+        """Test that an invalidation in one process reaches another process's L1 quickly"""
+        shared = FakeRedis()
+        now = [100.0]
+        monkeypatch.setattr(user_cache, '_redis', shared)
+        monkeypatch.setattr(user_cache.time, 'monotonic', lambda: now[0])
+        process_a, process_b = Process(), Process()
+        teacher = Teacher(name="T", login="t1", telegram_id=111)
+        student = Student(name="A", telegram_id=222, teacher=teacher)
+        session.add_all([teacher, student])
+        await session.commit()
+
+        for process in (process_a, process_b):
+            process.activate(monkeypatch)
+            assert await get_student_id(session, 222) == student.id
+            assert [s.name for s in await get_roster(session, teacher.id)] == ["A"]
+            await asyncio.gather(*user_cache._pending)
+
+        # Process A deletes the student and adds another one
+        process_a.activate(monkeypatch)
+        await session.delete(student)
+        session.add(Student(name="B", teacher_id=teacher.id))
+        await session.commit()
+        await invalidate_user(222)
+        await invalidate_roster(teacher.id)
+
+        process_b.activate(monkeypatch)
+        assert await get_student_id(session, 222) == student.id
+        now[0] += user_cache.SHARED_L1_TTL_SECONDS + 1
+        assert now[0] - 100.0 < user_cache.USER_CACHE_TTL_SECONDS
+        assert await get_student_id(session, 222) is None
+        assert [s.name for s in await get_roster(session, teacher.id)] == ["B"]
@@ -0,0 +1,61 @@
+"""Tests for UserService"""
+import pytest
+import pytest_asyncio
+from models import Teacher, Student
+from services.user_cache import cached_teacher_id, cached_student_id, remember_student, clear_user_cache
+from services.user_service import UserService
+
+
+@pytest_asyncio.fixture
+async def teacher(session):
+    """Create test teacher"""
+    teacher = Teacher(
+        name="User Teacher",
+        contact_info="user@example.com",
+        login="user_teacher",
+        telegram_id=121212
+    )
+    session.add(teacher)
+    await session.commit()
+    return teacher
+
+
+class TestTelegramLookups:
+    """Tests for the cached telegram_id lookups"""
+
+    @pytest.mark.asyncio
+    async def test_lookup_uses_cached_id(self, session, teacher):
+        """Test that a repeat lookup resolves through the id cache"""
+        clear_user_cache()
+        assert cached_teacher_id(teacher.telegram_id) is None
+
+        found = await UserService.get_teacher_by_telegram_id(session, teacher.telegram_id)
+        assert found is teacher
+        assert cached_teacher_id(teacher.telegram_id) == teacher.id
+        assert await UserService.get_teacher_by_telegram_id(session, teacher.telegram_id) is teacher
+        clear_user_cache()
+
+    @pytest.mark.asyncio
+    async def test_stale_cached_id_falls_back_to_query(self, session, teacher):
+        """Test that a cached id for a deleted row is dropped and re-resolved"""
+        student = Student(name="Cached", teacher_id=teacher.id, telegram_id=565656)
+        session.add(student)
+        await session.commit()
+        remember_student(565656, student.id + 1000)
+
+        assert await UserService.get_student_by_telegram_id(session, 565656) is student
+        assert cached_student_id(565656) == student.id
+        clear_user_cache()
+
+    @pytest.mark.asyncio
+    async def test_cached_id_of_another_user_is_rejected(self, session, teacher):
+        """Test that a cached id whose row belongs to someone else is not trusted"""
+        other = Student(name="Other", teacher_id=teacher.id, telegram_id=575757)
+        student = Student(name="Real", teacher_id=teacher.id, telegram_id=585858)
+        session.add_all([other, student])
+        await session.commit()
+        remember_student(585858, other.id)
+
+        assert await UserService.get_student_by_telegram_id(session, 585858) is student
+        assert cached_student_id(585858) == student.id
+        clear_user_cache()